@@ -1070,6 +1070,9 @@ class TSIterator:
 
 
 class Params:
+    # empty so that subclasses declaring __slots__ do not carry a __dict__
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
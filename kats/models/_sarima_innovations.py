@@ -0,0 +1,304 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Exact Gaussian likelihood of (seasonal) ARMA models via the innovations algorithm.
+
+This is the fast path used by :class:`kats.models.sarima.SARIMAModel` for
+models without exogenous regressors or deterministic trend. The differenced
+series is treated as a zero-mean ARMA process whose AR and MA polynomials are
+the products of the non-seasonal and seasonal ones. The likelihood follows
+Brockwell & Davis, *Introduction to Time Series and Forecasting*, section 5.3:
+after the first max(p, q) observations the innovations coefficients vanish
+beyond lag q, so a pass over the data costs O(n * q^2) instead of the
+O(n * state_dim^2) of the Kalman filter.
+
+The kernels are compiled with numba when it is installed; `_no_numba` is set
+otherwise and callers are expected to fall back to the Kalman filter.
+"""
+
+import logging
+import math
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from scipy.optimize import minimize
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.statespace.tools import diff
+
+try:
+    from numba import jit  # @manual
+
+    _no_numba = False
+except ImportError:
+    _no_numba = True
+
+    def jit(**kwargs):  # type: ignore
+        def jit_decorator(func):  # type: ignore
+            return func
+
+        return jit_decorator
+
+
+@jit(nopython=True, cache=True)
+def arma_acovf(phi: np.ndarray, theta: np.ndarray, sigma2: float, n: int) -> np.ndarray:
+    """Autocovariances at lags 0, ..., n - 1 of a causal ARMA process.
+
+    The process is y_t = sum_i phi_i y_{t-i} + e_t + sum_j theta_j e_{t-j} with
+    Var(e_t) = sigma2 (Brockwell & Davis, section 3.3, method 2).
+    """
+    p = phi.shape[0]
+    q = theta.shape[0]
+    # psi weights of the causal representation, up to lag q
+    psi = np.zeros(q + 1)
+    psi[0] = 1.0
+    for j in range(1, q + 1):
+        s = theta[j - 1]
+        for i in range(1, min(j, p) + 1):
+            s += phi[i - 1] * psi[j - i]
+        psi[j] = s
+
+    # sigma2 * sum_{j=k}^{q} theta_j psi_{j-k}, with theta_0 = 1
+    rhs = np.zeros(max(p, q) + 1)
+    for k in range(q + 1):
+        s = 0.0
+        for j in range(k, q + 1):
+            s += (1.0 if j == 0 else theta[j - 1]) * psi[j - k]
+        rhs[k] = sigma2 * s
+
+    acovf = np.zeros(max(n, p + 1))
+    # the first p + 1 autocovariances solve a linear system
+    a = np.eye(p + 1)
+    for k in range(p + 1):
+        for i in range(1, p + 1):
+            a[k, abs(k - i)] -= phi[i - 1]
+    acovf[: p + 1] = np.linalg.solve(a, rhs[: p + 1])
+    # the rest follow the AR recursion
+    for k in range(p + 1, acovf.shape[0]):
+        s = rhs[k] if k <= q else 0.0
+        for i in range(1, p + 1):
+            s += phi[i - 1] * acovf[k - i]
+        acovf[k] = s
+    return acovf[:n]
+
+
+@jit(nopython=True, cache=True)
+def _kappa(
+    i: int,
+    j: int,
+    phi: np.ndarray,
+    theta: np.ndarray,
+    acovf: np.ndarray,
+    m: int,
+) -> float:
+    """Autocovariance of the transformed process W (1-based time indices)."""
+    if i < j:
+        i, j = j, i
+    h = i - j
+    if i <= m:
+        return acovf[h]
+    if j <= m:
+        if i > 2 * m:
+            return 0.0
+        s = acovf[h]
+        for r in range(1, phi.shape[0] + 1):
+            s -= phi[r - 1] * acovf[abs(r - h)]
+        return s
+    q = theta.shape[0]
+    if h > q:
+        return 0.0
+    # sum_{r=0}^{q-h} theta_r theta_{r+h}, with theta_0 = 1
+    s = 1.0 if h == 0 else theta[h - 1]
+    for r in range(1, q - h + 1):
+        s += theta[r - 1] * theta[r + h - 1]
+    return s
+
+
+@jit(nopython=True, cache=True)
+def innovations_filter(
+    y: np.ndarray, phi: np.ndarray, theta: np.ndarray, acovf: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """One-step prediction errors of `y` and their relative variances.
+
+    Args:
+        y: the zero-mean series.
+        phi: AR coefficients.
+        theta: MA coefficients.
+        acovf: autocovariances of the ARMA process up to lag 2 * max(p, q),
+            computed with unit innovation variance.
+
+    Returns:
+        Tuple of the prediction errors y_t - E[y_t | y_1, ..., y_{t-1}] and the
+        ratios r_{t-1} of their variances to the innovation variance.
+    """
+    n = y.shape[0]
+    p = phi.shape[0]
+    q = theta.shape[0]
+    m = max(p, q)
+    resid = np.empty(n)
+    r = np.empty(n)
+    r[0] = _kappa(1, 1, phi, theta, acovf, m)
+    resid[0] = y[0]
+    if m == 0:
+        for t in range(1, n):
+            r[t] = r[0]
+            resid[t] = y[t]
+        return resid, r
+
+    # coefs[k, l - 1] holds theta_{k, l}; at most m of them are non-zero
+    coefs = np.zeros((n, m))
+    for t in range(1, n):
+        # predict y_{t+1} (1-based) from the first t observations
+        k0 = 0 if t < m else max(0, t - q)
+        for k in range(k0, t):
+            s = _kappa(t + 1, k + 1, phi, theta, acovf, m)
+            for j in range(k0, k):
+                s -= coefs[k, k - j - 1] * coefs[t, t - j - 1] * r[j]
+            coefs[t, t - k - 1] = s / r[k]
+        v = _kappa(t + 1, t + 1, phi, theta, acovf, m)
+        for j in range(k0, t):
+            c = coefs[t, t - j - 1]
+            v -= c * c * r[j]
+        r[t] = v
+
+        pred = 0.0
+        if t >= m:
+            for i in range(1, p + 1):
+                pred += phi[i - 1] * y[t - i]
+        for lag in range(1, min(t, m) + 1):
+            pred += coefs[t, lag - 1] * resid[t - lag]
+        resid[t] = y[t] - pred
+    return resid, r
+
+
+@jit(nopython=True, cache=True)
+def concentrated_loglike(
+    y: np.ndarray, phi: np.ndarray, theta: np.ndarray
+) -> Tuple[float, float]:
+    """Exact log-likelihood of a zero-mean ARMA model with sigma2 profiled out.
+
+    Returns:
+        Tuple of the log-likelihood and the maximum likelihood estimate of the
+        innovation variance.
+    """
+    n = y.shape[0]
+    m = max(phi.shape[0], theta.shape[0])
+    acovf = arma_acovf(phi, theta, 1.0, 2 * m + 1)
+    resid, r = innovations_filter(y, phi, theta, acovf)
+    ssr = 0.0
+    logdet = 0.0
+    for t in range(n):
+        ssr += resid[t] * resid[t] / r[t]
+        logdet += math.log(r[t])
+    sigma2 = ssr / n
+    llf = -0.5 * n * (math.log(2.0 * math.pi * sigma2) + 1.0) - 0.5 * logdet
+    return llf, sigma2
+
+
+def _polynomials(sarima: SARIMAX, params: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Expand SARIMAX parameters into the full AR and MA coefficient arrays."""
+    p = sarima.k_ar_params
+    q = sarima.k_ma_params
+    sp = sarima.k_seasonal_ar_params
+    s = sarima.seasonal_periods or 1
+
+    def lag_poly(coefs: np.ndarray, step: int, sign: float) -> np.ndarray:
+        poly = np.zeros(len(coefs) * step + 1)
+        poly[0] = 1.0
+        poly[step::step] = sign * coefs
+        return poly
+
+    ar = np.convolve(
+        lag_poly(params[:p], 1, -1.0),
+        lag_poly(params[p + q : p + q + sp], s, -1.0),
+    )
+    ma = np.convolve(
+        lag_poly(params[p : p + q], 1, 1.0),
+        lag_poly(params[p + q + sp : -1], s, 1.0),
+    )
+    return -ar[1:], ma[1:]
+
+
+def can_fit(sarima: SARIMAX) -> bool:
+    """Check whether the innovations likelihood applies to `sarima`."""
+    return (
+        not _no_numba
+        and sarima.k_exog == 0
+        and sarima.k_trend == 0
+        and not sarima.measurement_error
+        and not sarima.time_varying_regression
+        and not sarima.concentrate_scale
+        and sarima.enforce_stationarity
+        and sarima.k_params > 1
+        # the innovations filter has no missing-data handling
+        and bool(np.isfinite(sarima.endog).all())
+    )
+
+
+def fit(
+    sarima: SARIMAX,
+    endog: np.ndarray,
+    d: int,
+    seasonal_order: Tuple[int, ...],
+    start_params: Optional[np.ndarray] = None,
+    maxiter: int = 50,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """Estimate the parameters of `sarima` by maximizing the exact likelihood.
+
+    Args:
+        sarima: the SARIMAX model; must satisfy :func:`can_fit`.
+        endog: the undifferenced series.
+        d: the order of differencing.
+        seasonal_order: the (P, D, Q, s) seasonal order.
+        start_params: Optional; constrained starting parameters. Defaults to the
+            SARIMAX starting parameters.
+        maxiter: the maximum number of L-BFGS-B iterations.
+
+    Returns:
+        Tuple of the constrained parameters, including sigma2, and a dict of
+        optimizer diagnostics in the layout of statsmodels' `mle_retvals`.
+    """
+    y = diff(
+        np.asarray(endog, dtype=np.float64), d, seasonal_order[1], seasonal_order[3]
+    )
+    x0 = None
+    if start_params is not None:
+        x0 = sarima.untransform_params(np.asarray(start_params, dtype=np.float64))
+    if x0 is None or not np.all(np.isfinite(x0)):
+        # non-stationary or non-invertible starts have no unconstrained form
+        x0 = sarima.untransform_params(sarima.start_params)
+    x0 = x0[:-1]
+    nobs = y.shape[0]
+
+    def constrain(x: np.ndarray) -> np.ndarray:
+        return sarima.transform_params(np.append(x, 1.0))
+
+    def objective(x: np.ndarray) -> float:
+        phi, theta = _polynomials(sarima, constrain(x))
+        llf, _ = concentrated_loglike(y, phi, theta)
+        return -llf
+
+    # the likelihood is flat in the unconstrained parameters near the unit
+    # circle, where forward differences are too noisy for the line search
+    res = minimize(
+        objective,
+        x0,
+        method="L-BFGS-B",
+        jac="3-point",
+        options={"maxiter": maxiter},
+    )
+    params = constrain(res.x)
+    phi, theta = _polynomials(sarima, params)
+    llf, params[-1] = concentrated_loglike(y, phi, theta)
+    if not res.success:
+        logging.warning("SARIMA innovations fit did not converge: %s", res.message)
+    retvals = {
+        "fopt": -llf / nobs,
+        "gopt": res.jac / nobs,
+        "fcalls": res.nfev,
+        "warnflag": res.status,
+        "converged": bool(res.success),
+        "iterations": res.nit,
+    }
+    return params, retvals
@@ -13,13 +13,28 @@ weighted average and median ensembling.
 
 from __future__ import annotations
 
+import atexit
 import logging
-import math
-import multiprocessing
 import sys
+import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from copy import copy
+from functools import lru_cache
 from multiprocessing import cpu_count
-from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -43,6 +58,13 @@ from kats.utils.backtesters import BackTesterSimple
 # STL decomposition
 from kats.utils.decomposition import TimeSeriesDecomposition
 
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # Python 3.7
+    resource_tracker = None
+    shared_memory = None
+
+
 # from numpy.typing import ArrayLike
 ArrayLike = Union[Sequence[float], np.ndarray]
 
@@ -64,6 +86,13 @@ SMODELS = {
     # "sarima": sarima.SARIMAModel,
 }
 
+# thread and process pools shared by the native executors, created on first use
+_POOLS: Dict[str, Executor] = {}
+
+# series at least this long are handed to process workers through shared
+# memory instead of being pickled into every task
+SHM_MIN_LENGTH = 10000
+
 
 def _logged_error(msg: str) -> ValueError:
     """Log and raise an error."""
@@ -71,6 +100,179 @@ def _logged_error(msg: str) -> ValueError:
     return ValueError(msg)
 
 
+@lru_cache(maxsize=64)
+def _base_name(model_name: str) -> str:
+    """Map a model name such as `Prophet_smodel` to its `MODELS` key."""
+    return model_name.split("_")[0].lower()
+
+
+def _get_pool(kind: str = "process") -> Executor:
+    """Return the shared `thread` or `process` pool, creating it on first use.
+
+    A pool that broke, e.g. because a worker process died, is replaced so
+    that later calls don't keep failing.
+    """
+    pool = _POOLS.get(kind)
+    if pool is not None and getattr(pool, "_broken", False):
+        logging.warning("Replacing the broken %s pool.", kind)
+        pool.shutdown(wait=False)
+        pool = None
+    if pool is None:
+        num_process = min(len(MODELS), (cpu_count() - 1) // 2)
+        if num_process < 1:
+            num_process = 1
+        if kind == "thread":
+            executor_cls = ThreadPoolExecutor
+        else:
+            # start the tracker before forking so the workers share it and
+            # don't report the shared series they attach to as leaked
+            if resource_tracker is not None:
+                resource_tracker.ensure_running()
+            executor_cls = ProcessPoolExecutor
+        pool = _POOLS[kind] = executor_cls(max_workers=num_process)
+    return pool
+
+
+@atexit.register
+def _shutdown_pools() -> None:
+    """Shut down the shared pools when the interpreter exits."""
+    for pool in _POOLS.values():
+        pool.shutdown(wait=True)
+    _POOLS.clear()
+
+
+class _SharedSeries(NamedTuple):
+    """Picklable handle to a univariate series published in shared memory"""
+
+    shm_name: str
+    length: int
+    time_col_name: str
+    value_name: Hashable
+
+
+@contextmanager
+def _shared_series(
+    data: TimeSeriesData, enabled: bool = True
+) -> Iterator[Union[TimeSeriesData, _SharedSeries]]:
+    """Publish `data` once in shared memory for the process workers.
+
+    Yields a `_SharedSeries` handle for long, univariate float series with a
+    tz-naive time column, and `data` itself otherwise. The block is unlinked
+    when the context exits, so every task using the handle must be done.
+    """
+    value = data.value
+    if (
+        not enabled
+        or shared_memory is None
+        or len(data) < SHM_MIN_LENGTH
+        or not isinstance(value, pd.Series)
+        or value.dtype != np.float64
+        or data.time.dtype != np.dtype("datetime64[ns]")
+    ):
+        yield data
+        return
+
+    n = len(data)
+    shm = shared_memory.SharedMemory(create=True, size=16 * n)
+    try:
+        buf = np.ndarray((2, n), dtype=np.int64, buffer=shm.buf)
+        buf[0] = data.time.to_numpy().view(np.int64)
+        buf[1] = value.to_numpy().view(np.int64)
+        del buf  # release the export so the block can be closed
+        yield _SharedSeries(shm.name, n, data.time_col_name, value.name)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _load_series(data: Union[TimeSeriesData, _SharedSeries]) -> TimeSeriesData:
+    """Rebuild the TimeSeriesData behind a `_SharedSeries` handle"""
+    if isinstance(data, TimeSeriesData):
+        return data
+    shm = shared_memory.SharedMemory(name=data.shm_name)
+    try:
+        buf = np.ndarray((2, data.length), dtype=np.int64, buffer=shm.buf)
+        # copy out of the block: the parent unlinks it once the tasks finish
+        time = pd.Series(
+            buf[0].view("datetime64[ns]"), name=data.time_col_name, copy=True
+        )
+        value = pd.Series(buf[1].view(np.float64), name=data.value_name, copy=True)
+        del buf
+    finally:
+        shm.close()
+    return TimeSeriesData(time=time, value=value, time_col_name=data.time_col_name)
+
+
+def _predict_all(fitted: Dict[str, Any], steps: int) -> Dict[str, pd.DataFrame]:
+    """Predict `steps` ahead with every fitted model, indexed by time.
+
+    The models are independent, so their predictions run on the shared thread
+    pool; the statsmodels/Stan prediction code releases the GIL.
+    """
+    if len(fitted) <= 1:
+        return {k: v.predict(steps).set_index("time") for k, v in fitted.items()}
+    pool = _get_pool("thread")
+    futures = {k: pool.submit(v.predict, steps) for k, v in fitted.items()}
+    return {k: f.result().set_index("time") for k, f in futures.items()}
+
+
+@lru_cache(maxsize=32)
+def _future_dates(
+    last_date: pd.Timestamp, steps: int, freq: Optional[str]
+) -> pd.DatetimeIndex:
+    """The `steps` dates following `last_date` at frequency `freq`."""
+    dates = pd.date_range(start=last_date, periods=steps + 1, freq=freq)
+    return dates[dates != last_date]
+
+
+def _all_have_ci(predicted: Dict[str, pd.DataFrame]) -> bool:
+    """Check whether every forecast frame carries its own C.I. columns."""
+    return all(
+        "fcst_lower" in v.columns and "fcst_upper" in v.columns
+        for v in predicted.values()
+    )
+
+
+# (re-seasonalize, de-seasonalize) operations for each decomposition method
+_COMBINE: Dict[str, Tuple[np.ufunc, np.ufunc]] = {
+    "additive": (np.add, np.subtract),
+    "multiplicative": (np.multiply, np.divide),
+}
+
+
+def _combine_ops(decomposition_method: str) -> Tuple[np.ufunc, np.ufunc]:
+    """Look up the seasonal operations, treating unknown methods as multiplicative."""
+    return _COMBINE.get(decomposition_method, _COMBINE["multiplicative"])
+
+
+def _seasonal_vector(seasonality_unit: ArrayLike, steps: int) -> np.ndarray:
+    """Repeat one seasonal cycle to cover the forecasting horizon.
+
+    The result is a 1-D array of length `steps`, which broadcasts against
+    the columns of the forecast frames in `KatsEnsemble.reseasonalize`.
+    """
+    return np.resize(np.asarray(seasonality_unit, dtype=np.float64), steps)
+
+
+def _reseasonalize_frame(
+    desea_pred: pd.DataFrame, seas: np.ndarray, decomposition_method: str
+) -> pd.DataFrame:
+    """Re-seasonalize every column of a forecast frame in a single pass."""
+    combine, _ = _combine_ops(decomposition_method)
+    out = combine(desea_pred.to_numpy(dtype=np.float64), seas[:, None])
+    return pd.DataFrame(out, index=desea_pred.index, columns=desea_pred.columns)
+
+
+def _errors_to_weights(errors: Dict[str, float]) -> Dict[str, float]:
+    """Convert backtesting errors into normalized inverse-error weights."""
+    names = list(errors.keys())
+    errs = np.fromiter(
+        (errors[name] for name in names), dtype=np.float64, count=len(names)
+    )
+    inv = 1.0 / (errs + sys.float_info.epsilon)
+    return dict(zip(names, (inv / inv.sum()).tolist()))
+
+
 # pyre-fixme[24]: Generic type `Model` expects 1 type parameter.
 class KatsEnsemble(Model):
     """Decomposition based ensemble model in Kats
@@ -91,6 +293,10 @@ class KatsEnsemble(Model):
     fcst_dates: Optional[ArrayLike] = None
     fcst_df: Optional[pd.DataFrame] = None
     errors: Optional[Dict[str, Any]] = None
+    _seasonality_data: Optional[TimeSeriesData] = None
+    _last_date: Optional[pd.Timestamp] = None
+    _last_date_data: Optional[TimeSeriesData] = None
+    _native_ci: bool = False
 
     def __init__(
         self,
@@ -125,6 +331,28 @@ class KatsEnsemble(Model):
             "1/2 of the length of give time series"
             raise _logged_error(msg)
 
+        # validate executor kind
+        executor_kind = self.params.get("executor_kind", "thread")
+        if executor_kind not in ("thread", "process"):
+            msg = (
+                "Only support `thread` or `process` executor_kind, "
+                f"but got {executor_kind}."
+            )
+            raise _logged_error(msg)
+
+        # resolve model classes once, including the extra `_smodel` copies
+        # created for seasonal data; names outside `MODELS` are only usable by
+        # customized executors, so they are left out of the table
+        # pyre-fixme[24]: Generic type `Model` expects 1 type parameter.
+        self._model_cls: Dict[str, Type[Model]] = {}
+        for m in self.params["models"].models:
+            model_cls = MODELS.get(_base_name(m.model_name))
+            if model_cls is None:
+                continue
+            self._model_cls[m.model_name] = model_cls
+            if m.model_name.lower() in SMODELS.keys():
+                self._model_cls[m.model_name + "_smodel"] = model_cls
+
         # check customized forecastExecutor
         if ("forecastExecutor" in self.params.keys()) and (
             self.params["forecastExecutor"] is not None
@@ -141,6 +369,27 @@ class KatsEnsemble(Model):
             logging.info(msg)
             self.fitExecutor = self.params["fitExecutor"]
 
+    # pyre-fixme[24]: Generic type `Model` expects 1 type parameter.
+    def _model_class(self, model_name: str) -> Type[Model]:
+        """Look up the model class for `model_name` in the resolution table"""
+        model_cls = self._model_cls.get(model_name)
+        if model_cls is None:
+            # models passed straight to an executor may not be in the table yet
+            model_cls = MODELS[_base_name(model_name)]
+            self._model_cls[model_name] = model_cls
+        return model_cls
+
+    def _get_executor(self) -> Executor:
+        """Pick the pool used to fit or backtest the models
+
+        Most backends (statsmodels, Stan) release the GIL in their native code,
+        so by default the models run on threads, which avoids pickling the data
+        and the fitted models. Set `executor_kind` to "process" to opt out. The
+        two pools are not mixed within a call: forking the process pool while
+        thread workers are inside native code could deadlock the workers.
+        """
+        return _get_pool(self.params.get("executor_kind", "thread"))
+
     @staticmethod
     def seasonality_detector(data: TimeSeriesData) -> bool:
         """Detect seasonalities from given TimeSeriesData
@@ -157,6 +406,31 @@ class KatsEnsemble(Model):
         seasonality = detector.seasonality_detected
         return seasonality
 
+    def _detect_seasonality(self) -> bool:
+        """Detect seasonalities from `self.data`, reusing a previous result
+
+        The result is cached against the `self.data` object, so rebinding
+        `self.data` triggers a fresh detection.
+
+        Returns:
+            Flag for the presence of seasonality
+        """
+        if self._seasonality_data is not self.data:
+            self.seasonality = KatsEnsemble.seasonality_detector(self.data)
+            self._seasonality_data = self.data
+        return self.seasonality
+
+    def _get_last_date(self) -> pd.Timestamp:
+        """Return the last date of `self.data`, reusing a previous result
+
+        The result is cached against the `self.data` object, so rebinding
+        `self.data` picks up the new last date.
+        """
+        if self._last_date_data is not self.data:
+            self._last_date = self.data.time.max()
+            self._last_date_data = self.data
+        return self._last_date
+
     @staticmethod
     def deseasonalize(
         data: TimeSeriesData, decomposition_method: str
@@ -176,13 +450,13 @@ class KatsEnsemble(Model):
         decomposer = TimeSeriesDecomposition(data, decomposition_method)
         decomp = decomposer.decomposer()
 
-        sea_data = copy(decomp["seasonal"])
+        # the decomposer builds a fresh TimeSeriesData for each component
+        sea_data = decomp["seasonal"]
+        # shallow copy; only the value series is replaced below
         desea_data = copy(data)
 
-        if decomposition_method == "additive":
-            desea_data.value = desea_data.value - decomp["seasonal"].value
-        else:
-            desea_data.value = desea_data.value / decomp["seasonal"].value
+        _, remove = _combine_ops(decomposition_method)
+        desea_data.value = remove(data.value, sea_data.value)
         return sea_data, desea_data
 
     @staticmethod
@@ -209,73 +483,39 @@ class KatsEnsemble(Model):
             Dict of re-seasonalized data for each individual forecasting model
         """
 
-        rep = math.trunc(1 + steps / seasonality_length)
         seasonality_unit = sea_data.value[-seasonality_length:]
+        # the seasonal vector is the same for every model; build it once
+        seas = _seasonal_vector(seasonality_unit, steps)
+
+        combine, _ = _combine_ops(decomposition_method)
+        # placeholder C.I. for models without a native one
+        dummy_ci = np.nan if decomposition_method == "additive" else 0
 
         predicted = {}
         for model_name, desea_pred in desea_predict.items():
-            if decomposition_method == "additive":
-                if (
-                    "fcst_lower" in desea_pred.columns
-                    and "fcst_upper" in desea_pred.columns
-                ):
-                    # check consistency of time being index
-                    if "time" in desea_pred.columns:
-                        msg = "Setting time column as index"
-                        logging.info(msg)
-                        desea_pred.set_index("time", inplace=True)
-
-                    # native C.I calculated from individual model
-                    predicted[model_name] = (
-                        desea_pred
-                        + np.tile(
-                            np.tile(seasonality_unit, rep)[:steps], [3, 1]
-                        ).transpose()
-                    )
-                else:
-                    # no C.I from individual model
-                    tmp_fcst = desea_pred.fcst + np.tile(seasonality_unit, rep)[:steps]
-                    predicted[model_name] = pd.DataFrame(
-                        {
-                            "time": desea_pred.index,
-                            "fcst": tmp_fcst,
-                            "fcst_lower": np.nan,
-                            "fcst_upper": np.nan,
-                        },
-                        copy=False,
-                    ).set_index("time")
-
+            columns = desea_pred.columns
+            if "fcst_lower" in columns and "fcst_upper" in columns:
+                # check consistency of time being index
+                if "time" in desea_pred.columns:
+                    msg = "Setting time column as index"
+                    logging.info(msg)
+                    desea_pred.set_index("time", inplace=True)
+
+                # native C.I calculated from individual model
+                predicted[model_name] = _reseasonalize_frame(
+                    desea_pred, seas, decomposition_method
+                )
             else:
-                # multiplicative, element-wise multiply
-                if (
-                    "fcst_lower" in desea_pred.columns
-                    and "fcst_upper" in desea_pred.columns
-                ):
-                    # check consistency of time being index
-                    if "time" in desea_pred.columns:
-                        msg = "Setting time column as index"
-                        logging.info(msg)
-                        desea_pred.set_index("time", inplace=True)
-
-                    # native C.I calculated from individual model
-                    predicted[model_name] = (
-                        desea_pred
-                        * np.tile(
-                            np.tile(seasonality_unit, rep)[:steps], [3, 1]
-                        ).transpose()
-                    )
-                else:
-                    # no C.I from individual model
-                    tmp_fcst = desea_pred.fcst * np.tile(seasonality_unit, rep)[:steps]
-                    predicted[model_name] = pd.DataFrame(
-                        {
-                            "time": desea_pred.index,
-                            "fcst": tmp_fcst,
-                            "fcst_lower": 0,
-                            "fcst_upper": 0,
-                        },
-                        copy=False,
-                    ).set_index("time")
+                # no C.I from individual model
+                predicted[model_name] = pd.DataFrame(
+                    {
+                        "time": desea_pred.index,
+                        "fcst": combine(desea_pred.fcst.values, seas),
+                        "fcst_lower": dummy_ci,
+                        "fcst_upper": dummy_ci,
+                    },
+                    copy=False,
+                ).set_index("time")
 
         return predicted
 
@@ -288,7 +528,7 @@ class KatsEnsemble(Model):
     ) -> Tuple[Dict[str, Any], Optional[Dict[str, float]]]:
         """callable forecast executor
 
-        This is native implementation with Python's multiprocessing
+        This is native implementation with Python's concurrent.futures
         fit individual model in `models` with given `data`. Services
         who use KatsEnsemble need to implement their own executor for better
         performance, if no executor function is given, the native version will be
@@ -305,26 +545,18 @@ class KatsEnsemble(Model):
         """
 
         # Fit individual model with given data
-        num_process = min(len(MODELS), (cpu_count() - 1) // 2)
-        if num_process < 1:
-            num_process = 1
-        pool = multiprocessing.Manager().Pool(
-            processes=(num_process), maxtasksperchild=1000
-        )
-
-        fitted_models = {}
-        for model in models.models:
-            fitted_models[model.model_name] = pool.apply_async(
-                self._fit_single,
-                args=(
-                    data,
-                    MODELS[model.model_name.split("_")[0].lower()],
+        pool = self._get_executor()
+        use_shm = isinstance(pool, ProcessPoolExecutor)
+        with _shared_series(data, enabled=use_shm) as shared:
+            fitted_models = {}
+            for model in models.models:
+                fitted_models[model.model_name] = pool.submit(
+                    self._fit_single,
+                    shared if use_shm else data,
+                    self._model_class(model.model_name),
                     model.model_params,
-                ),
-            )
-        pool.close()
-        pool.join()
-        fitted = {model: res.get() for model, res in fitted_models.items()}
+                )
+            fitted = {model: res.result() for model, res in fitted_models.items()}
 
         # if auto back testing
         weights = self.backTestExecutor(err_method) if should_auto_backtest else None
@@ -337,7 +569,7 @@ class KatsEnsemble(Model):
         This is the fit methdo to fit individual forecasting model
         """
 
-        self.seasonality = KatsEnsemble.seasonality_detector(self.data)
+        self.seasonality = self._detect_seasonality()
 
         # check if self.params["seasonality_length"] is given
         if self.seasonality and self.params["seasonality_length"] is None:
@@ -409,11 +641,11 @@ class KatsEnsemble(Model):
             sea_data = self.sea_data
             assert sea_data is not None
             # we should pred two types of model
-            desea_fitted = {k: v for k, v in fitted.items() if "_smodel" not in k}
-            desea_predict = {
-                k: v.predict(self.steps).set_index("time")
-                for k, v in desea_fitted.items()
-            }
+            desea_fitted, fitted_smodel = {}, {}
+            for k, v in fitted.items():
+                (fitted_smodel if "_smodel" in k else desea_fitted)[k] = v
+            desea_predict = _predict_all(desea_fitted, self.steps)
+            desea_have_ci = _all_have_ci(desea_predict)
 
             # re-seasonalize
             predicted = KatsEnsemble.reseasonalize(
@@ -425,30 +657,23 @@ class KatsEnsemble(Model):
             )
 
             # add extra model prediction results from smodels
-            fitted_smodel = {k: v for k, v in fitted.items() if "_smodel" in k}
-            extra_predict = {
-                k: v.predict(self.steps).set_index("time")
-                for k, v in fitted_smodel.items()
-            }
+            extra_predict = _predict_all(fitted_smodel, self.steps)
+            self._native_ci = desea_have_ci and _all_have_ci(extra_predict)
 
             predicted.update(extra_predict)
             self.predicted = predicted
         else:
-            predicted = {
-                k: v.predict(self.steps).set_index("time") for k, v in fitted.items()
-            }
+            predicted = _predict_all(fitted, self.steps)
+            self._native_ci = _all_have_ci(predicted)
 
             # add dummy C.I if the model doesn't have native C.I
             # this is a hack for median ensemble; everyone model needs to have
             # its native C.I if user choose weighted average ensemble.
             for k, v in predicted.items():
                 # if predicted df doesn't have fcst_lower and fcst_upper
-                if not {"fcst_lower", "fcst_upper"}.issubset(v.columns):
-                    # add dummy C.I
-                    tmp_v = copy(v)
-                    tmp_v["fcst_lower"] = np.nan
-                    tmp_v["fcst_upper"] = np.nan
-                    predicted[k] = tmp_v
+                if "fcst_lower" not in v.columns or "fcst_upper" not in v.columns:
+                    # add dummy C.I; `assign` only allocates the two new columns
+                    predicted[k] = v.assign(fcst_lower=np.nan, fcst_upper=np.nan)
             self.predicted = predicted
         return self
 
@@ -468,7 +693,7 @@ class KatsEnsemble(Model):
             Tuple of predicted values and weights
         """
         self.steps = steps
-        self.seasonality = KatsEnsemble.seasonality_detector(self.data)
+        self.seasonality = self._detect_seasonality()
 
         # check if self.params["seasonality_length"] is given
         if (self.seasonality) and (self.params["seasonality_length"] is None):
@@ -494,6 +719,7 @@ class KatsEnsemble(Model):
                 steps=steps,
                 should_auto_backtest=auto_backtesting,
             )
+            desea_have_ci = _all_have_ci(desea_predict)
             # update the desea_predict with adding seasonality component
             # re-seasonalize
             predicted = KatsEnsemble.reseasonalize(
@@ -522,6 +748,8 @@ class KatsEnsemble(Model):
                 should_auto_backtest=auto_backtesting,
             )
 
+            self._native_ci = desea_have_ci and _all_have_ci(extra_predict)
+
             # combine with predict
             predicted.update(extra_predict)
             self.predicted = predicted
@@ -543,6 +771,7 @@ class KatsEnsemble(Model):
                 should_auto_backtest=auto_backtesting,
             )
             self.err = forecast_error
+            self._native_ci = _all_have_ci(predicted)
 
             # same as in predict method above
             # add dummy C.I if the model doesn't have native C.I
@@ -551,25 +780,15 @@ class KatsEnsemble(Model):
             for k, v in predicted.items():
                 # if predicted df doesn't have fcst_lower and fcst_upper
                 if "fcst_lower" not in v.columns or "fcst_upper" not in v.columns:
-                    # add dummy C.I
-                    tmp_v = copy(v)
-                    tmp_v["fcst_lower"] = np.nan
-                    tmp_v["fcst_upper"] = np.nan
-                    predicted[k] = tmp_v
+                    # add dummy C.I; `assign` only allocates the two new columns
+                    predicted[k] = v.assign(fcst_lower=np.nan, fcst_upper=np.nan)
 
             self.predicted = predicted
 
         # we need to transform err to weights if it's weighted avg
         if self.params["aggregation"] == "weightedavg":
             assert forecast_error is not None
-            original_weights = {
-                model: 1 / (err + sys.float_info.epsilon)
-                for model, err in forecast_error.items()
-            }
-            self.weights = {
-                model: err / sum(original_weights.values())
-                for model, err in original_weights.items()
-            }
+            self.weights = _errors_to_weights(forecast_error)
         else:
             self.weights = None
         return predicted, self.weights
@@ -599,31 +818,21 @@ class KatsEnsemble(Model):
         """
 
         # Fit individual model with given data
-        num_process = min(len(MODELS), (cpu_count() - 1) // 2)
-        if num_process < 1:
-            num_process = 1
-        pool = multiprocessing.Manager().Pool(
-            processes=(num_process), maxtasksperchild=1000
-        )
-
-        fitted_models = {}
-        for model in models.models:
-            fitted_models[model.model_name] = pool.apply_async(
-                self._fit_single,
-                args=(
-                    data,
-                    MODELS[model.model_name.split("_")[0].lower()],
+        pool = self._get_executor()
+        use_shm = isinstance(pool, ProcessPoolExecutor)
+        with _shared_series(data, enabled=use_shm) as shared:
+            fitted_models = {}
+            for model in models.models:
+                fitted_models[model.model_name] = pool.submit(
+                    self._fit_single,
+                    shared if use_shm else data,
+                    self._model_class(model.model_name),
                     model.model_params,
-                ),
-            )
-        pool.close()
-        pool.join()
-        fitted = {model: res.get() for model, res in fitted_models.items()}
+                )
+            fitted = {model: res.result() for model, res in fitted_models.items()}
 
         # simply predict with given steps
-        predicted = {}
-        for model_name, model_fitted in fitted.items():
-            predicted[model_name] = model_fitted.predict(steps).set_index("time")
+        predicted = _predict_all(fitted, steps)
 
         # if auto back testing
         self.model_params = models  # used by _backtester_all
@@ -648,54 +857,66 @@ class KatsEnsemble(Model):
             raise _logged_error("predict must be called before aggregate.")
 
         # create future dates
-        last_date = self.data.time.max()
-        dates = pd.date_range(start=last_date, periods=self.steps + 1, freq=self.freq)
-        self.dates = dates = dates[dates != last_date]
+        self.dates = dates = _future_dates(
+            self._get_last_date(), self.steps, self.freq
+        )
         self.fcst_dates = dates.to_pydatetime()
 
-        # collect the fcst, fcst_lower, and fcst_upper into dataframes
-        fcsts = {}
-        for col in ["fcst", "fcst_lower", "fcst_upper"]:
-            fcsts[col] = pd.concat(
-                [x[col].reset_index(drop=True) for x in predicted.values()],
-                axis=1,
-                copy=False,
-            )
-            fcsts[col].columns = predicted.keys()
-
         if self.params["aggregation"].lower() == "median":
-            # clean up dataframes with C.I as np.nan or zero
-            fcsts = self.clean_dummy_CI(fcsts, use_zero=False)
-            self.fcst_df = fcst_df = pd.DataFrame(
-                {
-                    "time": dates,
-                    "fcst": fcsts["fcst"].median(axis=1),
-                    "fcst_lower": fcsts["fcst_lower"].median(axis=1),
-                    "fcst_upper": fcsts["fcst_upper"].median(axis=1),
-                },
-                copy=False,
-            )
+            # collect the fcst, fcst_lower, and fcst_upper into arrays of
+            # shape (steps, n_models)
+            fcsts = {
+                col: np.column_stack(
+                    [x[col].to_numpy(dtype=np.float64) for x in predicted.values()]
+                )
+                for col in ("fcst", "fcst_lower", "fcst_upper")
+            }
+
+            # clean up dummy C.I given as zero; nanmedian skips np.nan.
+            # Nothing to clean when every model produced its own C.I.
+            if not self._native_ci:
+                for col in ("fcst_lower", "fcst_upper"):
+                    fcsts[col][fcsts[col] == 0] = np.nan
+            with warnings.catch_warnings():
+                # rows where no model has a native C.I stay np.nan
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                self.fcst_df = fcst_df = pd.DataFrame(
+                    {
+                        "time": dates,
+                        "fcst": np.nanmedian(fcsts["fcst"], axis=1),
+                        "fcst_lower": np.nanmedian(fcsts["fcst_lower"], axis=1),
+                        "fcst_upper": np.nanmedian(fcsts["fcst_upper"], axis=1),
+                    },
+                    copy=False,
+                )
         else:
-            if (
-                fcsts["fcst_lower"].isnull().values.any()
-                or fcsts["fcst_upper"].isnull().values.any()
-            ):
+            # stack fcst, fcst_lower, and fcst_upper of all models into an
+            # array of shape (steps, 3, n_models)
+            stacked = np.stack(
+                [
+                    x[["fcst", "fcst_lower", "fcst_upper"]].to_numpy(dtype=np.float64)
+                    for x in predicted.values()
+                ],
+                axis=-1,
+            )
+            if np.isnan(stacked[:, 1:, :]).any():
                 msg = "Conf. interval contains NaN, please check individual model."
                 raise _logged_error(msg)
             weights = self.weights
             assert weights is not None
-            weights = np.array(list(weights.values()))
+            # weight all three columns with a single matmul
+            fcst = stacked @ np.fromiter(weights.values(), dtype=np.float64)
             self.fcst_df = fcst_df = pd.DataFrame(
                 {
                     "time": dates,
-                    "fcst": fcsts["fcst"].dot(weights),
-                    "fcst_lower": fcsts["fcst_lower"].dot(weights),
-                    "fcst_upper": fcsts["fcst_upper"].dot(weights),
+                    "fcst": fcst[:, 0],
+                    "fcst_lower": fcst[:, 1],
+                    "fcst_upper": fcst[:, 2],
                 },
                 copy=False,
             )
 
-        logging.debug("Return forecast data: {fcst_df}".format(fcst_df=fcst_df))
+        logging.debug("Return forecast data: %s", fcst_df)
         return fcst_df
 
     @staticmethod
@@ -736,18 +957,18 @@ class KatsEnsemble(Model):
         weights, _ = self._backtester_all(err_method=err_method)
         return weights
 
+    @staticmethod
     def _fit_single(
-        self,
-        data: TimeSeriesData,
+        data: Union[TimeSeriesData, _SharedSeries],
         # pyre-fixme[24]: Generic type `Callable` expects 2 type parameters.
         model_func: Callable,
-        model_param: Params
+        model_param: Params,
         # pyre-fixme[24]: Generic type `Model` expects 1 type parameter.
     ) -> Model:
         """Private method to fit individual model
 
         Args:
-            data: the input time series data
+            data: the input time series data, or a handle to it in shared memory
             model_func: the callable func to fit models
             model_param: the corresponding model parameter class
 
@@ -756,12 +977,13 @@ class KatsEnsemble(Model):
         """
 
         # get the model function call
-        m = model_func(params=model_param, data=data)
+        m = model_func(params=model_param, data=_load_series(data))
         m.fit()
         return m
 
+    @staticmethod
     def _backtester_single(
-        self,
+        data: Union[TimeSeriesData, _SharedSeries],
         params: Params,
         # pyre-fixme[24]: Generic type `Model` expects 1 type parameter.
         model_class: Type[Model],
@@ -772,6 +994,7 @@ class KatsEnsemble(Model):
         """Private method to run single back testing process
 
         Args:
+            data: the input time series data, or a handle to it in shared memory
             params: Kats model parameters
             model_class: Untyped. Defines type of model
             train_percentage: float. Percentage of data used for training
@@ -785,7 +1008,7 @@ class KatsEnsemble(Model):
 
         bt = BackTesterSimple(
             [err_method],
-            self.data,
+            _load_series(data),
             params,
             train_percentage,
             test_percentage,
@@ -811,30 +1034,21 @@ class KatsEnsemble(Model):
         if model_params is None:
             raise _logged_error("fit must be called before backtesting.")
 
-        num_process = min(len(MODELS.keys()), (cpu_count() - 1) // 2)
-        if num_process < 1:
-            num_process = 1
-        pool = multiprocessing.Manager().Pool(
-            processes=(num_process), maxtasksperchild=1000
-        )
-        backtesters = {}
-        for model in model_params.models:
-            backtesters[model.model_name] = pool.apply_async(
-                self._backtester_single,
-                args=(
+        data = self.data
+        pool = self._get_executor()
+        use_shm = isinstance(pool, ProcessPoolExecutor)
+        with _shared_series(data, enabled=use_shm) as shared:
+            backtesters = {}
+            for model in model_params.models:
+                backtesters[model.model_name] = pool.submit(
+                    self._backtester_single,
+                    shared if use_shm else data,
                     model.model_params,
-                    MODELS[model.model_name.split("_")[0].lower()],
-                ),
-                kwds={"err_method": err_method},
-            )
-        pool.close()
-        pool.join()
-        self.errors = errors = {model: res.get() for model, res in backtesters.items()}
-        original_weights = {
-            model: 1 / (err + sys.float_info.epsilon) for model, err in errors.items()
-        }
-        weights = {
-            model: err / sum(original_weights.values())
-            for model, err in original_weights.items()
-        }
+                    self._model_class(model.model_name),
+                    err_method=err_method,
+                )
+            self.errors = errors = {
+                model: res.result() for model, res in backtesters.items()
+            }
+        weights = _errors_to_weights(errors)
         return weights, errors
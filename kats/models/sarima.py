@@ -4,18 +4,55 @@
 # LICENSE file in the root directory of this source tree.
 
 import logging
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from copy import copy
+from itertools import repeat
+from multiprocessing import cpu_count
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+from pandas.tseries.frequencies import to_offset
 from kats.consts import Params, TimeSeriesData
+from kats.models import _sarima_innovations
 from kats.models.model import Model
 from kats.utils.parameter_tuning_utils import get_default_sarima_parameter_search_space
+from statsmodels.tsa.statespace.kalman_filter import (
+    MEMORY_CONSERVE,
+    MEMORY_NO_FORECAST,
+)
 from statsmodels.tsa.statespace.mlemodel import MLEResults
 from statsmodels.tsa.statespace.sarimax import SARIMAX
 
 ArrayLike = np.ndarray
 
+# constrained fitted parameters of the most recent warm-started fits, keyed by
+# model specification and ordered from least to most recently used; guarded by
+# _WARM_STARTS_LOCK since ensemble members are fitted on threads
+_WARM_STARTS: Dict[Tuple[Any, ...], np.ndarray] = {}
+_WARM_STARTS_LOCK = threading.Lock()
+_MAX_WARM_STARTS = 256
+
+# fit() reduces memory usage by default once len(data) * k_states ** 2 exceeds
+# this, i.e. when keeping every filter and smoother array would take gigabytes
+LOW_MEMORY_THRESHOLD = 5e8
+# statsmodels' MEMORY_CONSERVE, except for the one-step forecasts: these are O(n)
+# for a univariate series and the forecast intervals are computed from them
+_AUTO_CONSERVE_MEMORY: int = MEMORY_CONSERVE & ~MEMORY_NO_FORECAST
+
 
 class SARIMAParams(Params):
     """Parameter class for SARIMA model
@@ -67,6 +104,25 @@ class SARIMAParams(Params):
             diffuse initialization for non-stationary states. Default is False.
     """
 
+    __slots__ = [
+        "p",
+        "d",
+        "q",
+        "exog",
+        "seasonal_order",
+        "trend",
+        "measurement_error",
+        "time_varying_regression",
+        "mle_regression",
+        "simple_differencing",
+        "enforce_stationarity",
+        "enforce_invertibility",
+        "hamilton_representation",
+        "concentrate_scale",
+        "trend_offset",
+        "use_exact_diffuse",
+    ]
+
     def __init__(
         self,
         p: int,
@@ -106,7 +162,11 @@ class SARIMAParams(Params):
         self.use_exact_diffuse = use_exact_diffuse
         logging.debug(
             "Initialized SARIMAParams with parameters. "
-            f"p:{p}, d:{d}, q:{q},seasonal_order:{seasonal_order}"
+            "p:%s, d:%s, q:%s,seasonal_order:%s",
+            p,
+            d,
+            q,
+            seasonal_order,
         )
 
     def validate_params(self) -> None:
@@ -116,6 +176,44 @@ class SARIMAParams(Params):
         pass
 
 
+@contextmanager
+def _conserving_memory(sarima: SARIMAX, conserve_memory: int) -> Iterator[None]:
+    """Temporarily set the memory conservation flags of `sarima`."""
+    previous = sarima.ssm.conserve_memory
+    sarima.ssm.set_conserve_memory(conserve_memory)
+    try:
+        yield
+    finally:
+        sarima.ssm.set_conserve_memory(previous)
+
+
+def _get_warm_start(key: Tuple[Any, ...]) -> Optional[np.ndarray]:
+    """Return the last fitted parameters stored for `key`, if any."""
+    with _WARM_STARTS_LOCK:
+        params = _WARM_STARTS.pop(key, None)
+        if params is not None:
+            _WARM_STARTS[key] = params
+    return params
+
+
+def _set_warm_start(key: Tuple[Any, ...], params: np.ndarray) -> None:
+    """Store fitted parameters for `key`, evicting the least recently used."""
+    with _WARM_STARTS_LOCK:
+        _WARM_STARTS.pop(key, None)
+        if len(_WARM_STARTS) >= _MAX_WARM_STARTS:
+            del _WARM_STARTS[next(iter(_WARM_STARTS))]
+        _WARM_STARTS[key] = params
+
+
+def _fit_one(
+    data: TimeSeriesData, params: SARIMAParams, fit_kwargs: Dict[str, Any]
+) -> "SARIMAModel":
+    """Fit a SARIMA model; module level so that process pools can pickle it."""
+    m = SARIMAModel(data=data, params=params)
+    m.fit(**fit_kwargs)
+    return m
+
+
 class SARIMAModel(Model[SARIMAParams]):
     """Model class for SARIMA.
 
@@ -150,6 +248,15 @@ class SARIMAModel(Model[SARIMAParams]):
     y_fcst_lower: Optional[np.ndarray] = None
     y_fcst_upper: Optional[np.ndarray] = None
     dates: Optional[pd.DatetimeIndex] = None
+    _sarimax: Optional[SARIMAX] = None
+    _sarimax_key: Optional[Tuple[Any, ...]] = None
+    _sarimax_endog: Optional[pd.Series] = None
+    _sarimax_exog: Optional[ArrayLike] = None
+    _freq: Optional[pd.Timedelta] = None
+    _freq_data: Optional[TimeSeriesData] = None
+    _has_history: bool = True
+    _mean_weights: Optional[np.ndarray] = None
+    _mean_weights_model: Optional[MLEResults] = None
 
     def __init__(
         self,
@@ -179,7 +286,8 @@ class SARIMAModel(Model[SARIMAParams]):
         optim_score: Optional[str] = None,
         optim_complex_step: bool = True,
         optim_hessian: Optional[str] = None,
-        low_memory: bool = False,
+        low_memory: Optional[bool] = None,
+        warm_start: bool = False,
     ) -> None:
         """Fit SARIMA model by maximum likelihood via Kalman filter.
 
@@ -228,7 +336,13 @@ class SARIMAModel(Model[SARIMAParams]):
                 None.
             low_memory: Optional; A boolean to specify whether or not to reduce memory
                 usage. If True, some features of the results object will not be
-                available. Default is False.
+                available. Default is None, which turns it on (and, unless
+                cov_type is given, skips the parameter covariance) when
+                len(data) * k_states ** 2 exceeds `LOW_MEMORY_THRESHOLD`.
+            warm_start: Optional; A boolean to specify whether or not to start the
+                optimization from the parameters of the last warm-started fit with
+                the same model specification, when start_params is not given, and
+                to store the fitted parameters for later fits. Default is False.
 
         Returns:
             None.
@@ -249,14 +363,262 @@ class SARIMAModel(Model[SARIMAParams]):
         self.optim_score = optim_score
         self.optim_complex_step = optim_complex_step
         self.optim_hessian = optim_hessian
+
+        sarima = self._get_sarimax()
+        # memory conservation flags for building the results of the fit
+        conserve_memory = MEMORY_CONSERVE if low_memory else 0
+        auto_low_memory = False
+        if low_memory is None:
+            # pyre-fixme[6]: Expected `Sized` for 1st positional only parameter
+            low_memory = len(self.data) * sarima.k_states**2 > LOW_MEMORY_THRESHOLD
+            if low_memory:
+                logging.info(
+                    "Fitting SARIMA with %s states in low memory mode.",
+                    sarima.k_states,
+                )
+                auto_low_memory = True
+                conserve_memory = _AUTO_CONSERVE_MEMORY
+                if cov_type is None:
+                    self.cov_type = "none"
         self.low_memory = low_memory
+        key = self._sarimax_key
+        if warm_start and start_params is None:
+            warm_params = _get_warm_start(key)
+            if warm_params is not None and not transformed:
+                # the stored parameters are constrained
+                warm_params = sarima.untransform_params(warm_params)
+            self.start_params = warm_params
+
+        # the innovations fit has no counterpart for the other optimizer
+        # arguments, so it only replaces the default L-BFGS fit
+        if (
+            method == "lbfgs"
+            and callback is None
+            and full_output
+            and not disp
+            and optim_score is None
+            and optim_complex_step
+            and optim_hessian is None
+            and _sarima_innovations.can_fit(sarima)
+        ):
+            self.model = model = self._fit_innovations(sarima, conserve_memory)
+        else:
+            # the memory conservation flags also make statsmodels build the
+            # results with the filter only; its own low_memory drops the
+            # forecast intervals, so the automatic mode sets the flags itself
+            with _conserving_memory(sarima, conserve_memory):
+                self.model = model = sarima.fit(
+                    start_params=self.start_params,
+                    transformed=self.transformed,
+                    includes_fixed=self.includes_fixed,
+                    cov_type=self.cov_type,
+                    cov_kwds=self.cov_kwds,
+                    method=self.method,
+                    maxiter=self.maxiter,
+                    full_output=self.full_output,
+                    disp=self.disp,
+                    callback=self.callback,
+                    return_params=self.return_params,
+                    optim_score=self.optim_score,
+                    optim_complex_step=self.optim_complex_step,
+                    optim_hessian=self.optim_hessian,
+                    low_memory=self.low_memory and not auto_low_memory,
+                )
+        self._has_history = True
+        if warm_start:
+            fitted_params = model if return_params else model.params
+            _set_warm_start(key, np.array(fitted_params))
+        logging.info("Fitted SARIMA.")
+
+    def fit_grid(
+        self,
+        param_list: Sequence[SARIMAParams],
+        n_jobs: int = -1,
+        **kwargs: Any,
+    ) -> List["SARIMAModel"]:
+        """Fit a SARIMA model on `self.data` for each parameter set in parallel.
+
+        The fits are independent and CPU bound, so they run in a process pool.
+
+        Args:
+            param_list: A sequence of :class:`SARIMAParams` to fit.
+            n_jobs: Optional; An integer for the number of worker processes.
+                Negative values count back from the number of CPUs, so -1 uses
+                all of them. Default is -1.
+            kwargs: Keyword arguments passed to `fit` for every model.
+
+        Returns:
+            A list of fitted :class:`SARIMAModel`, in the order of `param_list`.
+        """
+        if n_jobs < 0:
+            n_jobs = cpu_count() + 1 + n_jobs
+        n_jobs = min(max(n_jobs, 1), len(param_list))
+        data = self.data
+        if n_jobs <= 1:
+            # pyre-fixme[6]: Incompatible parameter type
+            return [_fit_one(data, params, kwargs) for params in param_list]
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            return list(pool.map(_fit_one, repeat(data), param_list, repeat(kwargs)))
+
+    def update(
+        self,
+        new_data: TimeSeriesData,
+        exog: Optional[ArrayLike] = None,
+        keep_history: bool = True,
+    ) -> None:
+        """Add new observations to a fitted model without re-estimating it.
+
+        The fitted parameters are kept and the Kalman filter is run over the new
+        observations, so forecasts start from the end of the extended series.
+        With `keep_history`, the results are rebuilt for the whole series
+        (`MLEResults.append`), which costs one filter pass over all the data but
+        no optimization. Otherwise only the new observations are filtered
+        (`MLEResults.extend`), which costs O(state_dim^2) per observation but
+        leaves no in-sample predictions for `predict(include_history=True)`.
+
+        Args:
+            new_data: :class:`kats.consts.TimeSeriesData` with the observations
+                following `self.data`.
+            exog: Optional; A numpy array of exogenous values for the new
+                observations. Required if the model has exogenous variables.
+            keep_history: Optional; A boolean to specify whether or not to keep
+                the in-sample predictions for the whole series. Once they are
+                dropped, later updates only filter the new observations too.
+                Default is True.
+
+        Returns:
+            None.
+        """
+        model = self.model
+        if model is None:
+            msg = "Call fit() before update()."
+            logging.error(msg)
+            raise ValueError(msg)
+        if not isinstance(new_data.value, pd.Series):
+            msg = f"Only support univariate time series, but get {new_data.value}."
+            logging.error(msg)
+            raise ValueError(msg)
+        if (self.params.exog is not None) and (exog is None):
+            msg = (
+                "SARIMA model was initialized with exogenous variables. Exogenous "
+                "variables must be used to update. use `exog=`"
+            )
+            logging.error(msg)
+            raise ValueError(msg)
+
+        endog = new_data.value.to_numpy()
+        if keep_history and self._has_history:
+            self.model = model.append(endog, exog=exog, refit=False)
+        else:
+            self.model = model.extend(endog, exog=exog)
+            self._has_history = False
+
+        old_data = self.data
+        data = copy(old_data)
+        data.extend(new_data, validate=False)
+        self.data = data
+        if self._freq_data is old_data:
+            # new observations follow the frequency of the series
+            self._freq_data = data
+        if exog is not None:
+            # extend a copy: the params may be shared with other models
+            params = copy(self.params)
+            # pyre-fixme[6]: Incompatible parameter type
+            params.exog = np.concatenate((params.exog, exog))
+            self.params = params
+
+        # forecasts of the previous fit are stale now
+        self.fcst_df = None
+        self.y_fcst = None
+        self.y_fcst_lower = None
+        self.y_fcst_upper = None
+        self.dates = None
+        logging.info("Updated SARIMA with %s new observations.", len(new_data))
+
+    # pyre-fixme[24]: Generic type `np.ndarray` expects 2 type parameters.
+    def _fit_innovations(
+        self, sarima: SARIMAX, conserve_memory: int
+    ) -> Union[MLEResults, np.ndarray]:
+        """Fit `sarima` by maximizing the innovations form of its likelihood.
+
+        Only the parameter search differs from `SARIMAX.fit`: the exact ARMA
+        likelihood of the differenced series is evaluated by the numba kernels
+        in :mod:`kats.models._sarima_innovations`, and the results object is
+        then built by a single pass of the statsmodels Kalman smoother.
+        """
+        start_params = self.start_params
+        if start_params is not None and not self.transformed:
+            start_params = sarima.transform_params(np.asarray(start_params))
+        params, retvals = _sarima_innovations.fit(
+            sarima,
+            # pyre-fixme[16]: `Optional` has no attribute `value`.
+            self.data.value.to_numpy(),
+            self.params.d,
+            self.params.seasonal_order,
+            start_params=start_params,
+            maxiter=self.maxiter,
+        )
+        if self.return_params:
+            return params
+
+        res = self._results(sarima, params, conserve_memory)
+        res.mle_retvals = retvals
+        res.mle_settings = {"optimizer": "innovations", "maxiter": self.maxiter}
+        return res
+
+    def _results(
+        self, sarima: SARIMAX, params: np.ndarray, conserve_memory: int
+    ) -> MLEResults:
+        """Run the final Kalman pass for fitted parameters, like `SARIMAX.fit`.
+
+        With memory conservation only the filter runs, keeping the arrays that
+        `conserve_memory` does not drop; otherwise the smoother runs as well.
+        """
+        if not conserve_memory:
+            return sarima.smooth(params, cov_type=self.cov_type, cov_kwds=self.cov_kwds)
+        with _conserving_memory(sarima, conserve_memory):
+            return sarima.filter(params, cov_type=self.cov_type, cov_kwds=self.cov_kwds)
+
+    def _get_sarimax(self) -> SARIMAX:
+        """Return the SARIMAX model for the current data and parameters.
+
+        The model is rebuilt only if `self.data` or the model specification
+        changed since the last fit; repeated fits reuse its state space setup.
+        """
+        params = self.params
+        exog = params.exog
+        key = (
+            (params.p, params.d, params.q),
+            tuple(params.seasonal_order),
+            params.trend if params.trend is None else str(params.trend),
+            None if exog is None else np.shape(exog)[1:],
+            params.measurement_error,
+            params.time_varying_regression,
+            params.mle_regression,
+            params.simple_differencing,
+            params.enforce_stationarity,
+            params.enforce_invertibility,
+            params.hamilton_representation,
+            params.concentrate_scale,
+            params.trend_offset,
+            params.use_exact_diffuse,
+        )
+        # pyre-fixme[16]: `Optional` has no attribute `value`.
+        endog = self.data.value
+        sarima = self._sarimax
+        if (
+            sarima is not None
+            and key == self._sarimax_key
+            and endog is self._sarimax_endog
+            and exog is self._sarimax_exog
+        ):
+            return sarima
 
         logging.info("Created SARIMA model.")
         sarima = SARIMAX(
-            # pyre-fixme[16]: `Optional` has no attribute `value`.
-            self.data.value,
-            order=(self.params.p, self.params.d, self.params.q),
-            exog=self.params.exog,
+            endog,
+            order=(params.p, params.d, params.q),
+            exog=exog,
             seasonal_order=self.params.seasonal_order,
             trend=self.params.trend,
             measurement_error=self.params.measurement_error,
@@ -270,24 +632,11 @@ class SARIMAModel(Model[SARIMAParams]):
             trend_offset=self.params.trend_offset,
             use_exact_diffuse=self.params.use_exact_diffuse,
         )
-        self.model = sarima.fit(
-            start_params=self.start_params,
-            transformed=self.transformed,
-            includes_fixed=self.includes_fixed,
-            cov_type=self.cov_type,
-            cov_kwds=self.cov_kwds,
-            method=self.method,
-            maxiter=self.maxiter,
-            full_output=self.full_output,
-            disp=self.disp,
-            callback=self.callback,
-            return_params=self.return_params,
-            optim_score=self.optim_score,
-            optim_complex_step=self.optim_complex_step,
-            optim_hessian=self.optim_hessian,
-            low_memory=self.low_memory,
-        )
-        logging.info("Fitted SARIMA.")
+        self._sarimax = sarima
+        self._sarimax_key = key
+        self._sarimax_endog = endog
+        self._sarimax_exog = exog
+        return sarima
 
     # pyre-fixme[14]: `predict` overrides method defined in `Model` inconsistently.
     # pyre-fixme[15]: `predict` overrides method defined in `Model` inconsistently.
@@ -324,16 +673,17 @@ class SARIMAModel(Model[SARIMAParams]):
             logging.error(msg)
             raise ValueError(msg)
 
-        logging.debug(f"Call predict() with parameters. steps:{steps}, kwargs:{kwargs}")
+        logging.debug(
+            "Call predict() with parameters. steps:%s, kwargs:%s", steps, kwargs
+        )
         self.include_history = include_history
-        # pyre-fixme[16]: `Optional` has no attribute `infer_freq_robust`.
-        self.freq = kwargs.get("freq", self.data.infer_freq_robust())
+        self.freq = kwargs["freq"] if "freq" in kwargs else self._infer_freq()
         self.alpha = alpha
 
         fcst = model.get_forecast(steps, exog=exog)
 
         logging.info("Generated forecast data from SARIMA model.")
-        logging.debug(f"Forecast data: {fcst}")
+        logging.debug("Forecast data: %s", fcst)
 
         if fcst.predicted_mean.isna().sum() == steps:
             msg = (
@@ -344,54 +694,25 @@ class SARIMAModel(Model[SARIMAParams]):
             raise ValueError(msg)
 
         self.y_fcst = fcst.predicted_mean
-        pred_interval = fcst.conf_int(alpha=self.alpha)
+        pred_interval = fcst.conf_int(alpha=self.alpha).to_numpy()
 
-        if pred_interval.iloc[0, 0] < pred_interval.iloc[0, 1]:
-            self.y_fcst_lower = np.array(pred_interval.iloc[:, 0])
-            self.y_fcst_upper = np.array(pred_interval.iloc[:, 1])
+        if pred_interval[0, 0] < pred_interval[0, 1]:
+            self.y_fcst_lower = pred_interval[:, 0]
+            self.y_fcst_upper = pred_interval[:, 1]
         else:
-            self.y_fcst_lower = np.array(pred_interval.iloc[:, 1])
-            self.y_fcst_upper = np.array(pred_interval.iloc[:, 0])
-
-        # pyre-fixme[16]: `Optional` has no attribute `time`.
-        last_date = self.data.time.max()
-        dates = pd.date_range(start=last_date, periods=steps + 1, freq=self.freq)
+            self.y_fcst_lower = pred_interval[:, 1]
+            self.y_fcst_upper = pred_interval[:, 0]
 
-        self.dates = dates[dates != last_date]  # Return correct number of periods
+        self.dates = self._forecast_dates(steps)
 
         if include_history:
-            # generate historical fit
-            history_fcst = model.get_prediction(0)
-            history_ci = history_fcst.conf_int()
-            if ("lower" in history_ci.columns[0]) and (
-                "upper" in history_ci.columns[1]
-            ):
-                ci_lower_name, ci_upper_name = (
-                    history_ci.columns[0],
-                    history_ci.columns[1],
-                )
-            else:
+            if not self._has_history:
                 msg = (
-                    "Error when getting prediction interval from statsmodels SARIMA API"
+                    "In-sample predictions are not available after "
+                    "update(keep_history=False)."
                 )
                 logging.error(msg)
                 raise ValueError(msg)
-            self.fcst_df = fcst_df = pd.DataFrame(
-                {
-                    "time": np.concatenate(
-                        (pd.to_datetime(self.data.time), self.dates)
-                    ),
-                    "fcst": np.concatenate((history_fcst.predicted_mean, self.y_fcst)),
-                    "fcst_lower": np.concatenate(
-                        (history_ci[ci_lower_name], self.y_fcst_lower)
-                    ),
-                    "fcst_upper": np.concatenate(
-                        (history_ci[ci_upper_name], self.y_fcst_upper)
-                    ),
-                },
-                copy=False,
-            )
-
             # the first k elements of the fcst and lower/upper are not legitmate
             # thus we need to assign np.nan to avoid confusion
             # k = max(p, d, q) + max(P, D, Q) * seasonal_order + 1
@@ -400,8 +721,44 @@ class SARIMAModel(Model[SARIMAParams]):
                 + max(self.params.seasonal_order[0:3]) * self.params.seasonal_order[3]
                 + 1
             )
+            # fill the history and forecast rows of one preallocated buffer
+            n_hist = model.nobs
+            out = np.empty((n_hist + steps, 3), dtype=np.float64)
+            out[n_hist:, 0] = self.y_fcst
+            out[n_hist:, 1] = self.y_fcst_lower
+            out[n_hist:, 2] = self.y_fcst_upper
+            # generate historical fit, skipping the rows that are masked anyway
+            start = min(k + 1, n_hist)
+            if start < n_hist:
+                history_fcst = model.get_prediction(start)
+                history_ci = history_fcst.conf_int()
+                if ("lower" in history_ci.columns[0]) and (
+                    "upper" in history_ci.columns[1]
+                ):
+                    ci_lower_name, ci_upper_name = (
+                        history_ci.columns[0],
+                        history_ci.columns[1],
+                    )
+                else:
+                    msg = (
+                        "Error when getting prediction interval from statsmodels "
+                        "SARIMA API"
+                    )
+                    logging.error(msg)
+                    raise ValueError(msg)
+                out[start:n_hist, 0] = history_fcst.predicted_mean
+                out[start:n_hist, 1] = history_ci[ci_lower_name]
+                out[start:n_hist, 2] = history_ci[ci_upper_name]
+            out[: k + 1] = np.nan
 
-            fcst_df.loc[0:k, ["fcst", "fcst_lower", "fcst_upper"]] = np.nan
+            self.fcst_df = fcst_df = pd.DataFrame(
+                out, columns=["fcst", "fcst_lower", "fcst_upper"], copy=False
+            )
+            # pyre-fixme[16]: `Optional` has no attribute `time`.
+            time = self.data.time
+            if not is_datetime64_any_dtype(time):
+                time = pd.to_datetime(time)
+            fcst_df.insert(0, "time", np.concatenate((time, self.dates)))
         else:
             self.fcst_df = fcst_df = pd.DataFrame(
                 {
@@ -413,9 +770,133 @@ class SARIMAModel(Model[SARIMAParams]):
                 copy=False,
             )
 
-        logging.debug(f"Return forecast data: {fcst_df}")
+        logging.debug("Return forecast data: %s", fcst_df)
         return fcst_df
 
+    def predict_many(
+        self,
+        steps_list: Sequence[int],
+        exog: Optional[ArrayLike] = None,
+        alpha: float = 0.05,
+        **kwargs: Any,
+    ) -> List[pd.DataFrame]:
+        """Predict several forecast horizons with one forecast pass.
+
+        The model is forecast once up to the longest horizon and the result is
+        sliced for each of the others; this gives the same forecasts as calling
+        `predict` once per horizon. Afterwards the model attributes (e.g.
+        `fcst_df`) describe the longest horizon.
+
+        Args:
+            steps_list: A sequence of integers for the forecast steps.
+            exog: A numpy array of exogenous values to be passed to forecast,
+                covering the longest horizon.
+            alpha: A float for confidence level. Default is 0.05.
+            kwargs: Keyword arguments passed to `predict`, e.g. `freq` or
+                `include_history`; with the latter every frame starts with the
+                in-sample predictions.
+
+        Returns:
+            A list with a :class:`pandas.DataFrame` of forecasts and confidence
+            intervals for each horizon in `steps_list`.
+        """
+        if len(steps_list) == 0:
+            msg = "steps_list must contain at least one horizon."
+            logging.error(msg)
+            raise ValueError(msg)
+        max_steps = max(steps_list)
+        fcst_df = self.predict(max_steps, exog=exog, alpha=alpha, **kwargs)
+        # with include_history the forecasts follow the in-sample rows
+        n_hist = len(fcst_df) - max_steps
+        return [fcst_df.iloc[: n_hist + steps].copy() for steps in steps_list]
+
+    def predict_mean(
+        self, steps: int, exog: Optional[ArrayLike] = None, **kwargs: Any
+    ) -> pd.DataFrame:
+        """Predict the conditional mean only, without prediction intervals.
+
+        For models without exogenous variables or trend the forecasts are
+        Z T^h a, where a is the last predicted state and Z and T are the design
+        and transition matrices of the fitted model. The rows Z T^h are cached
+        per fit, so a forecast is a single matrix-vector product and the state
+        covariances are never propagated. Other models use `get_forecast`.
+
+        Args:
+            steps: An integer for forecast steps.
+            exog: A numpy array of exogenous values to be passed to forecast.
+
+        Returns:
+            A :class:`pandas.DataFrame` with the time and fcst columns.
+        """
+        model = self.model
+        if model is None:
+            msg = "Call fit() before predict_mean()."
+            logging.error(msg)
+            raise ValueError(msg)
+        if (self.params.exog is not None) and (exog is None):
+            msg = (
+                "SARIMA model was initialized with exogenous variables. Exogenous "
+                "variables must be used to predict. use `exog=`"
+            )
+            logging.error(msg)
+            raise ValueError(msg)
+
+        self.freq = kwargs["freq"] if "freq" in kwargs else self._infer_freq()
+        if model.model.k_exog == 0 and model.model.k_trend == 0:
+            filter_results = model.filter_results
+            fcst = self._forecast_weights(model, steps) @ (
+                filter_results.predicted_state[:, -1]
+            )
+        else:
+            fcst = model.get_forecast(steps, exog=exog).predicted_mean.to_numpy()
+        return pd.DataFrame(
+            {"time": self._forecast_dates(steps), "fcst": fcst}, copy=False
+        )
+
+    def _forecast_weights(self, model: MLEResults, steps: int) -> np.ndarray:
+        """Rows Z T^h, h = 0, ..., steps - 1, of the mean forecast of `model`.
+
+        The rows are cached against the results object and only recomputed
+        for a new fit or a longer horizon.
+        """
+        weights = self._mean_weights
+        if (
+            weights is None
+            or self._mean_weights_model is not model
+            or len(weights) < steps
+        ):
+            filter_results = model.filter_results
+            transition = filter_results.transition[:, :, 0]
+            weights = np.empty((steps, transition.shape[0]))
+            weights[0] = filter_results.design[0, :, 0]
+            for h in range(1, steps):
+                weights[h] = weights[h - 1] @ transition
+            self._mean_weights = weights
+            self._mean_weights_model = model
+        return weights[:steps]
+
+    def _forecast_dates(self, steps: int) -> pd.DatetimeIndex:
+        """The `steps` dates following the end of `self.data` at `self.freq`."""
+        # pyre-fixme[16]: `Optional` has no attribute `time`.
+        last_date = self.data.time.max()
+        # start one period after the history instead of dropping last_date
+        return pd.date_range(
+            start=last_date + to_offset(self.freq), periods=steps, freq=self.freq
+        )
+
+    def _infer_freq(self) -> pd.Timedelta:
+        """Infer the frequency of `self.data`, reusing a previous result
+
+        The result is cached against the `self.data` object, so rebinding
+        `self.data` triggers a fresh inference.
+        """
+        data = self.data
+        if self._freq_data is not data:
+            # pyre-fixme[16]: `Optional` has no attribute `infer_freq_robust`.
+            self._freq = data.infer_freq_robust()
+            self._freq_data = data
+        return self._freq
+
     def __str__(self) -> str:
         return "SARIMA"
 
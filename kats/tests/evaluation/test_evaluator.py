@@ -17,17 +17,6 @@ from kats.tests.test_backtester_dummy_data import PROPHET_0_108_FCST_DUMMY_DATA
 
 np.random.seed(42)
 
-# Constant Values
-FCST_EVALUATION_ERRORS = pd.DataFrame(
-    {  # Rounded to 6 decimals
-        "mape": [0.0075546],
-        "smape": [0.007588],
-        "mae": [3.361111],
-        "mse": [12.916667],
-        "rmse": [3.593976],
-    }
-)
-
 
 class EvaluatorTest(unittest.TestCase):
     @classmethod
@@ -38,6 +27,22 @@ class EvaluatorTest(unittest.TestCase):
         # pyre-fixme[45]: Cannot instantiate abstract class `Evaluator`.
         cls.evaluator = Evaluator()
 
+        # Perturb a copy so the shared dummy data is left untouched
+        df = PROPHET_0_108_FCST_DUMMY_DATA.copy()
+        df["rand_fcst"] = np.random.randint(1, 6, df.shape[0]) + df["fcst"]
+        cls.labels = df["fcst"].to_numpy()
+        cls.preds = df["rand_fcst"].to_numpy()
+
+        cls._expected_df = pd.DataFrame(
+            {  # Rounded to 6 decimals
+                "mape": [0.0075546],
+                "smape": [0.007588],
+                "mae": [3.361111],
+                "mse": [12.916667],
+                "rmse": [3.593976],
+            }
+        )
+
     def test_create_evaluation_run(self) -> None:
         self.evaluator.create_evaluation_run(run_name="valid_run")
         self.assertEqual(
@@ -78,26 +83,18 @@ class EvaluatorTest(unittest.TestCase):
             self.evaluator.get_evaluation_run(run_name="invalid_retrieve_run")
 
     def test_evaluate(self) -> None:
-        # Set up data
-        PROPHET_0_108_FCST_DUMMY_DATA["rand_fcst"] = (
-            np.random.randint(1, 6, PROPHET_0_108_FCST_DUMMY_DATA.shape[0])
-            + PROPHET_0_108_FCST_DUMMY_DATA["fcst"]
-        )
-        labels = np.asarray(PROPHET_0_108_FCST_DUMMY_DATA["fcst"])
-        preds = np.asarray(PROPHET_0_108_FCST_DUMMY_DATA["rand_fcst"])
-
         # Set up evaluator
         self.evaluator.create_evaluation_run(run_name="test_evaluate")
-        self.evaluator.runs["test_evaluate"].preds = preds
+        self.evaluator.runs["test_evaluate"].preds = self.preds
 
         eval_res = self.evaluator.evaluate(
             run_name="test_evaluate",
-            metric_to_func={name: core_metric(name) for name in FCST_EVALUATION_ERRORS},
-            labels=labels,
+            metric_to_func={name: core_metric(name) for name in self._expected_df},
+            labels=self.labels,
         )
         assert_frame_equal(
             eval_res,
-            FCST_EVALUATION_ERRORS,
+            self._expected_df,
             check_exact=False,
             check_less_precise=4,
             atol=0.5,
@@ -3,9 +3,11 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-import sys
+import os
+from concurrent.futures.process import BrokenProcessPool
 import unittest
 import unittest.mock as mock
+from typing import Any, Dict, Tuple
 from unittest import TestCase
 
 import numpy as np
@@ -22,9 +24,11 @@ from kats.models import (
     theta,
 )
 from kats.models.ensemble.ensemble import BaseEnsemble, BaseModelParams, EnsembleParams
+from kats.models.ensemble import kats_ensemble
 from kats.models.ensemble.kats_ensemble import KatsEnsemble
 from kats.models.ensemble.median_ensemble import MedianEnsembleModel
 from kats.models.ensemble.weighted_avg_ensemble import WeightedAvgEnsemble
+from kats.utils.testing import mock_pool_predictions
 from parameterized.parameterized import parameterized
 
 np.random.seed(123321)
@@ -409,8 +413,10 @@ class testKatsEnsemble(TestCase):
 
             m = KatsEnsemble(data=ts_data, params=KatsEnsembleParam)
 
-            with mock.patch("multiprocessing.managers.SyncManager.Pool") as mock_pooled:
-                mock_fit_model = mock_pooled.return_value.apply_async.return_value.get
+            with mock.patch(
+                "kats.models.ensemble.kats_ensemble._get_pool"
+            ) as mock_pooled:
+                mock_fit_model = mock_pool_predictions(mock_pooled)
                 mock_fit_model.return_value.predict = mock.MagicMock(return_value=preds)
                 # fit the model
                 m.fit()
@@ -470,10 +476,12 @@ class testKatsEnsemble(TestCase):
             }
             m = KatsEnsemble(data=ts_data, params=KatsEnsembleParam)
 
-            with mock.patch("multiprocessing.managers.SyncManager.Pool") as mock_pooled:
-                mock_fit_model = mock_pooled.return_value.apply_async.return_value.get
+            with mock.patch(
+                "kats.models.ensemble.kats_ensemble._get_pool"
+            ) as mock_pooled:
+                mock_fit_model = mock_pool_predictions(mock_pooled)
                 mock_fit_model.return_value.predict = mock.MagicMock(return_value=preds)
-                mock_fit_model.return_value.__add__ = mock.MagicMock(
+                mock_fit_model.return_value.__float__ = mock.MagicMock(
                     return_value=np.random.rand()
                 )
                 # fit the model
@@ -483,9 +491,7 @@ class testKatsEnsemble(TestCase):
                 # no predictions should be made yet
                 mock_fit_model.return_value.predict.assert_not_called()
                 # backtesting should be done after calling fit
-                mock_fit_model.return_value.__add__.assert_called_with(
-                    sys.float_info.epsilon
-                )
+                mock_fit_model.return_value.__float__.assert_called()
 
                 # now run predict on the ensemble model
                 m.predict(steps=steps)
@@ -497,16 +503,14 @@ class testKatsEnsemble(TestCase):
                 mock_pooled.reset_mock()
                 mock_pooled.assert_not_called()
                 mock_fit_model.return_value.predict.assert_not_called()
-                mock_fit_model.return_value.__add__.assert_not_called()
+                mock_fit_model.return_value.__float__.assert_not_called()
 
                 # now retry the above with forecast rather than fit/predict
                 m.forecast(steps=30)
                 mock_pooled.assert_called()
 
                 # backtesting should be done after calling fit
-                mock_fit_model.return_value.__add__.assert_called_with(
-                    sys.float_info.epsilon
-                )
+                mock_fit_model.return_value.__float__.assert_called()
 
                 # now run predict on the ensemble model
                 # m.predict(steps=steps)
@@ -514,6 +518,127 @@ class testKatsEnsemble(TestCase):
                 m.aggregate()
                 m.plot()
 
+    def test_seasonality_detection_cached(self) -> None:
+        preds = get_fake_preds(self.TSData, fcst_periods=30, fcst_freq="MS")
+        KatsEnsembleParam = {
+            "models": EnsembleParams(
+                [BaseModelParams("linear", linear_model.LinearModelParams())]
+            ),
+            "aggregation": "median",
+            "seasonality_length": 12,
+            "decomposition_method": "additive",
+        }
+        m = KatsEnsemble(data=self.TSData, params=KatsEnsembleParam)
+
+        with mock.patch.object(
+            KatsEnsemble, "seasonality_detector", return_value=False
+        ) as mock_detector, mock.patch(
+            "kats.models.ensemble.kats_ensemble._get_pool"
+        ) as mock_pooled:
+            mock_fit_model = mock_pool_predictions(mock_pooled)
+            mock_fit_model.return_value.predict = mock.MagicMock(return_value=preds)
+            m.fit()
+            m.forecast(steps=30)
+            mock_detector.assert_called_once()
+
+            # rebinding the data invalidates the cached result
+            m.data = self.TSData_dummy
+            m.forecast(steps=30)
+            self.assertEqual(mock_detector.call_count, 2)
+
+            # and so does the last date the forecast dates start from
+            m.data = self.TSData[:-12]
+            m.forecast(steps=30)
+            m.aggregate()
+            self.assertEqual(m.dates[0], self.TSData.time.iloc[-12])
+
+    def test_custom_model_name(self) -> None:
+        # model names outside MODELS are served by a customized fitExecutor
+        def fit_executor(
+            data: TimeSeriesData, models: EnsembleParams, **kwargs: Any
+        ) -> Tuple[Dict[str, Any], None]:
+            fitted = {}
+            for m in models.models:
+                model = linear_model.LinearModel(data, m.model_params)
+                model.fit()
+                fitted[m.model_name] = model
+            return fitted, None
+
+        KatsEnsembleParam = {
+            "models": EnsembleParams(
+                [BaseModelParams("mycustom", linear_model.LinearModelParams())]
+            ),
+            "aggregation": "median",
+            "seasonality_length": 12,
+            "decomposition_method": "additive",
+            "fitExecutor": fit_executor,
+        }
+        m = KatsEnsemble(data=self.TSData, params=KatsEnsembleParam)
+        with mock.patch.object(
+            KatsEnsemble, "seasonality_detector", return_value=False
+        ):
+            m.fit()
+        m.predict(steps=30)
+        self.assertEqual(len(m.aggregate()), 30)
+
+    @unittest.skipIf(
+        kats_ensemble.shared_memory is None, "shared_memory requires Python 3.8+"
+    )
+    def test_shared_series(self) -> None:
+        n = kats_ensemble.SHM_MIN_LENGTH
+        ts = TimeSeriesData(
+            time=pd.Series(pd.date_range("2000-01-01", periods=n, freq="H")),
+            value=pd.Series(np.random.RandomState(0).rand(n), name="y"),
+        )
+        with kats_ensemble._shared_series(ts) as shared:
+            self.assertIsInstance(shared, kats_ensemble._SharedSeries)
+            loaded = kats_ensemble._load_series(shared)
+        self.assertEqual(loaded, ts)
+
+        # short series and disabled sharing pass the data through untouched
+        with kats_ensemble._shared_series(self.TSData) as shared:
+            self.assertIs(shared, self.TSData)
+        with kats_ensemble._shared_series(ts, enabled=False) as shared:
+            self.assertIs(shared, ts)
+
+    def test_executor_kind(self) -> None:
+        models = EnsembleParams(
+            [
+                BaseModelParams("linear", linear_model.LinearModelParams()),
+                BaseModelParams("theta", theta.ThetaParams(m=12)),
+            ]
+        )
+        for kind in ["thread", "process"]:
+            KatsEnsembleParam = {
+                "models": models,
+                "aggregation": "median",
+                "seasonality_length": 12,
+                "decomposition_method": "additive",
+                "executor_kind": kind,
+            }
+            m = KatsEnsemble(data=self.TSData, params=KatsEnsembleParam)
+            with mock.patch.object(
+                KatsEnsemble, "seasonality_detector", return_value=False
+            ), mock.patch(
+                "kats.models.ensemble.kats_ensemble._get_pool",
+                wraps=kats_ensemble._get_pool,
+            ) as mock_pooled:
+                m.fit()
+            # every model runs in the pool of the chosen kind
+            mock_pooled.assert_called_once_with(kind)
+            self.assertEqual(set(m.fitted), {"linear", "theta"})
+
+    def test_broken_pool_replaced(self) -> None:
+        with mock.patch.dict(kats_ensemble._POOLS, clear=True):
+            pool = kats_ensemble._get_pool("process")
+            # a worker dying breaks the pool
+            with self.assertRaises(BrokenProcessPool):
+                pool.submit(os._exit, 1).result()
+            new_pool = kats_ensemble._get_pool("process")
+            self.assertIsNot(new_pool, pool)
+            self.assertEqual(new_pool.submit(abs, -1).result(), 1)
+            kats_ensemble._shutdown_pools()
+
     def test_others(self) -> None:
         model_params = EnsembleParams(
             [
@@ -562,6 +687,22 @@ class testKatsEnsemble(TestCase):
             KatsEnsembleParam,
         )
 
+        # test invalid executor kind
+        KatsEnsembleParam = {
+            "models": model_params,
+            "aggregation": "median",
+            "seasonality_length": 12,
+            "decomposition_method": "additive",
+            "executor_kind": "random_executor",
+        }
+
+        self.assertRaises(
+            ValueError,
+            KatsEnsemble,
+            self.TSData,
+            KatsEnsembleParam,
+        )
+
         # test logging with default executors
         KatsEnsembleParam = {
             "models": model_params,
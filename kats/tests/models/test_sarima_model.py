@@ -4,7 +4,8 @@
 # LICENSE file in the root directory of this source tree.
 
 import unittest
-from typing import Any, Dict, Optional, Union
+import unittest.mock as mock
+from typing import Any, Dict, Optional, Tuple, Union
 from unittest import TestCase
 
 import numpy as np
@@ -12,6 +13,7 @@ import pandas as pd
 from kats.compat.pandas import assert_frame_equal
 from kats.consts import TimeSeriesData
 from kats.data.utils import load_air_passengers, load_data
+from kats.models import _sarima_innovations
 from kats.models.sarima import SARIMAModel, SARIMAParams
 from kats.tests.models.test_models_dummy_data import (
     AIR_FCST_15_SARIMA_PARAM_1_MODEL_1,
@@ -27,6 +29,7 @@ from kats.tests.models.test_models_dummy_data import (
     EXOG_FCST_15_SARIMA_PARAM_EXOG_MODEL_1,
 )
 from parameterized.parameterized import parameterized
+from statsmodels.tsa.statespace.sarimax import SARIMAX
 
 AIR_TS: pd.DataFrame = load_air_passengers()
 MULTI_DF: pd.DataFrame = load_data("multivariate_anomaly_simulated_data.csv")
@@ -286,6 +289,287 @@ class SARIMAModelTest(TestCase):
             # pyre-fixme[6]: Incompatible parameter type...
             m.fit(**model_params)
 
+    def test_refit_and_warm_start(self) -> None:
+        m = SARIMAModel(
+            data=TEST_DATA["monthly"]["ts"], params=TEST_DATA["monthly"]["p1"]
+        )
+        m.fit(**TEST_DATA["monthly"]["m1"])
+        sarimax, fitted_params = m._sarimax, m.model.params
+
+        # refitting unchanged data and parameters reuses the SARIMAX model
+        with mock.patch.dict("kats.models.sarima._WARM_STARTS", clear=True):
+            m.fit(**TEST_DATA["monthly"]["m1"])
+            self.assertIs(m._sarimax, sarimax)
+            np.testing.assert_allclose(m.model.params, fitted_params)
+            # fits without warm_start don't store their parameters
+            m2 = SARIMAModel(
+                data=TEST_DATA["monthly"]["ts"], params=TEST_DATA["monthly"]["p1"]
+            )
+            m2.fit(warm_start=True, **TEST_DATA["monthly"]["m1"])
+            self.assertIsNone(m2.start_params)
+
+            # a new model with the same specification starts from the last fit
+            m3 = SARIMAModel(
+                data=TEST_DATA["monthly"]["ts"], params=TEST_DATA["monthly"]["p1"]
+            )
+            m3.fit(warm_start=True, **TEST_DATA["monthly"]["m1"])
+            self.assertIsNot(m3._sarimax, sarimax)
+            np.testing.assert_allclose(m3.start_params, m2.model.params)
+            np.testing.assert_allclose(m3.model.params, fitted_params, rtol=1e-4)
+
+            # unconstrained start parameters are untransformed first
+            m3.fit(warm_start=True, transformed=False, **TEST_DATA["monthly"]["m1"])
+            np.testing.assert_allclose(
+                m3.start_params, m3._sarimax.untransform_params(m3.model.params)
+            )
+            np.testing.assert_allclose(m3.model.params, fitted_params, rtol=1e-4)
+
+    # pyre-fixme[56]: Pyre was not able to infer the type of the decorator `parameter...
+    @parameterized.expand(
+        [
+            ["arma", (2, 0, 3), (0, 0, 0, 0)],
+            ["pure_ma", (0, 0, 2), (0, 0, 0, 0)],
+            ["seasonal", (1, 0, 1), (1, 0, 1, 12)],
+        ]
+    )
+    def test_innovations_loglike(
+        self, name: str, order: Tuple[int, int, int], seasonal_order: Tuple[int, ...]
+    ) -> None:
+        y = np.random.RandomState(0).randn(200)
+        sarimax = SARIMAX(y, order=order, seasonal_order=seasonal_order)
+        params = sarimax.start_params
+        phi, theta = _sarima_innovations._polynomials(sarimax, params)
+        m = max(len(phi), len(theta))
+        acovf = _sarima_innovations.arma_acovf(phi, theta, 1.0, 2 * m + 1)
+        resid, r = _sarima_innovations.innovations_filter(y, phi, theta, acovf)
+        var = r * params[-1]
+        llf = -0.5 * (
+            len(y) * np.log(2 * np.pi) + np.log(var).sum() + (resid**2 / var).sum()
+        )
+        self.assertAlmostEqual(llf, sarimax.loglike(params), places=6)
+
+    def test_innovations_fit(self) -> None:
+        params = TEST_DATA["monthly"]["p1"]
+        m = SARIMAModel(data=TEST_DATA["monthly"]["ts"], params=params)
+        m.fit()
+        self.assertEqual(m.model.mle_settings["optimizer"], "innovations")
+
+        # the Kalman filter based fit finds the same optimum
+        sarimax = SARIMAX(
+            TEST_DATA["monthly"]["ts"].value,
+            order=(params.p, params.d, params.q),
+        ).fit(disp=False)
+        np.testing.assert_allclose(m.model.params, sarimax.params, rtol=1e-3)
+
+        # other optimizer arguments are left to the Kalman filter based fit
+        m.fit(optim_complex_step=False)
+        self.assertEqual(m.model.mle_settings["optimizer"], "lbfgs")
+
+    def test_innovations_fit_near_unit_root(self) -> None:
+        n = 600
+        rs = np.random.RandomState(0)
+        t = np.arange(n)
+        y = (
+            50
+            + 10 * np.sin(2 * np.pi * t / 12)
+            + 0.3 * np.cumsum(rs.randn(n))
+            + 2 * rs.randn(n)
+        )
+        ts = TimeSeriesData(
+            time=pd.Series(pd.date_range("2000-01-01", periods=n, freq="MS")),
+            value=pd.Series(y),
+        )
+        m = SARIMAModel(ts, SARIMAParams(p=1, d=0, q=1, seasonal_order=(1, 0, 1, 12)))
+        m.fit()
+        self.assertEqual(m.model.mle_settings["optimizer"], "innovations")
+        sarimax = SARIMAX(y, order=(1, 0, 1), seasonal_order=(1, 0, 1, 12)).fit(
+            disp=False
+        )
+        self.assertGreaterEqual(m.model.llf, sarimax.llf - 1e-3)
+
+    def test_freq_inferred_once(self) -> None:
+        m = SARIMAModel(
+            data=TEST_DATA["monthly"]["ts"], params=TEST_DATA["monthly"]["p1"]
+        )
+        m.fit(**TEST_DATA["monthly"]["m1"])
+        with mock.patch.object(
+            TimeSeriesData,
+            "infer_freq_robust",
+            autospec=True,
+            side_effect=TimeSeriesData.infer_freq_robust,
+        ) as mock_infer:
+            m.predict(steps=STEPS_1)
+            m.predict(steps=STEPS_2)
+            mock_infer.assert_called_once()
+
+            # an explicit freq skips the inference
+            m.predict(steps=STEPS_1, freq="MS")
+            self.assertEqual(m.freq, "MS")
+            mock_infer.assert_called_once()
+
+    def test_predict_many(self) -> None:
+        m = SARIMAModel(
+            data=TEST_DATA["monthly"]["ts"], params=TEST_DATA["monthly"]["p1"]
+        )
+        m.fit(**TEST_DATA["monthly"]["m1"])
+        res = m.predict_many([STEPS_1, STEPS_2], freq="MS")
+        self.assertEqual(len(res), 2)
+        for steps, fcst in zip([STEPS_1, STEPS_2], res):
+            assert_frame_equal(fcst, m.predict(steps=steps, freq="MS"))
+
+        with self.assertRaises(ValueError):
+            m.predict_many([])
+
+    def test_predict_many_include_history(self) -> None:
+        ts = TEST_DATA["monthly"]["ts"]
+        m = SARIMAModel(data=ts, params=TEST_DATA["monthly"]["p1"])
+        m.fit(**TEST_DATA["monthly"]["m1"])
+        steps_list = [STEPS_1, STEPS_2]
+        res = m.predict_many(steps_list, include_history=True)
+        for steps, fcst in zip(steps_list, res):
+            self.assertEqual(len(fcst), len(ts) + steps)
+            # the forecasts start after the in-sample rows
+            assert_frame_equal(
+                fcst.iloc[len(ts) :].reset_index(drop=True),
+                m.predict(steps=steps).reset_index(drop=True),
+            )
+            assert_frame_equal(fcst, m.predict(steps=steps, include_history=True))
+
+    @parameterized.expand(
+        [
+            ("arima", TEST_DATA["monthly"]["p1"]),
+            ("seasonal", SARIMAParams(p=1, d=1, q=1, seasonal_order=(1, 1, 1, 12))),
+            ("trend", TEST_DATA["monthly"]["p2"]),
+        ]
+    )
+    def test_predict_mean(self, name: str, params: SARIMAParams) -> None:
+        ts = TEST_DATA["monthly"]["ts"]
+        m = SARIMAModel(data=ts[:-STEPS_1], params=params)
+        m.fit(**TEST_DATA["monthly"]["m1"])
+        for steps in [STEPS_2, STEPS_1]:
+            fcst = m.predict(steps=steps)
+            res = m.predict_mean(steps=steps)
+            np.testing.assert_array_equal(res.time, fcst.time)
+            np.testing.assert_allclose(res.fcst, fcst.fcst, rtol=1e-10)
+
+        # the cached forecast rows follow the results after an update
+        m.update(ts[-STEPS_1:])
+        np.testing.assert_allclose(
+            m.predict_mean(steps=STEPS_1).fcst,
+            m.predict(steps=STEPS_1).fcst,
+            rtol=1e-10,
+        )
+
+    def test_update(self) -> None:
+        ts = TEST_DATA["monthly"]["ts"]
+        params = TEST_DATA["monthly"]["p1"]
+        m = SARIMAModel(data=ts[:-STEPS_1], params=params)
+        m.fit(**TEST_DATA["monthly"]["m1"])
+        fitted_params = m.model.params
+        m.update(ts[-STEPS_1:])
+        np.testing.assert_array_equal(m.model.params, fitted_params)
+        self.assertEqual(len(m.data), len(ts))
+
+        res = m.predict(steps=STEPS_1, include_history=True)
+        self.assertEqual(len(res), len(ts) + STEPS_1)
+        self.assertEqual(res.time.iloc[-STEPS_1 - 1], ts.time.iloc[-1])
+        fcst = m.predict(steps=STEPS_1)
+
+        # filtering only the new observations gives the same forecasts
+        m2 = SARIMAModel(data=ts[:-STEPS_1], params=params)
+        m2.fit(**TEST_DATA["monthly"]["m1"])
+        m2.update(ts[-STEPS_1:], keep_history=False)
+        assert_frame_equal(m2.predict(steps=STEPS_1), fcst)
+        with self.assertRaises(ValueError):
+            m2.predict(steps=STEPS_1, include_history=True)
+
+    def test_update_exog(self) -> None:
+        df = MULTI_DF
+        n = len(df) - STEPS_1
+        ts = TimeSeriesData(df[["time", "0"]])
+        exog = df["1"].values
+        params = SARIMAParams(p=1, d=1, q=1, exog=exog[: n - STEPS_1])
+        m = SARIMAModel(data=ts[: n - STEPS_1], params=params)
+        m.fit(**TEST_DATA["monthly"]["m1"])
+        m.update(ts[n - STEPS_1 : n], exog=exog[n - STEPS_1 : n])
+
+        # the caller's params are left alone
+        self.assertEqual(len(params.exog), n - STEPS_1)
+        np.testing.assert_array_equal(m.params.exog, exog[:n])
+        fcst = m.predict(steps=STEPS_1, exog=exog[n:], freq="D")
+        self.assertFalse(fcst.fcst.isna().any())
+
+        # refitting uses the extended exogenous variables
+        m.fit(**TEST_DATA["monthly"]["m1"])
+        self.assertEqual(m.model.nobs, n)
+
+        with self.assertRaises(ValueError):
+            m.update(ts[n:])
+
+    def test_auto_low_memory(self) -> None:
+        m = SARIMAModel(
+            data=TEST_DATA["monthly"]["ts"], params=TEST_DATA["monthly"]["p2"]
+        )
+        m.fit(**TEST_DATA["monthly"]["m1"])
+        self.assertFalse(m.low_memory)
+
+        with mock.patch("kats.models.sarima.LOW_MEMORY_THRESHOLD", 100):
+            m.fit(**TEST_DATA["monthly"]["m1"])
+            self.assertTrue(m.low_memory)
+            self.assertEqual(m.cov_type, "none")
+            self.assertTrue(m.model.filter_results.memory_no_predicted)
+            # unlike statsmodels' low_memory, the forecast intervals are kept
+            res = m.predict(steps=STEPS_1)
+            self.assertFalse(res.isna().any().any())
+
+            # and so are the optimizer diagnostics
+            m.fit()
+            self.assertTrue(m.model.filter_results.memory_no_predicted)
+            self.assertEqual(m.model.mle_settings["optimizer"], "lbfgs")
+            self.assertIn("converged", m.model.mle_retvals)
+
+            # an explicit choice is kept
+            m.fit(low_memory=False)
+            self.assertFalse(m.low_memory)
+
+    @parameterized.expand(
+        [
+            ("arima", SARIMAParams(p=1, d=1, q=1)),
+            ("arma", SARIMAParams(p=1, d=0, q=1)),
+            ("ar", SARIMAParams(p=2, d=0, q=0)),
+        ]
+    )
+    def test_missing_data(self, name: str, params: SARIMAParams) -> None:
+        df = TEST_DATA["monthly"]["ts"].to_dataframe()
+        df.iloc[50, 1] = np.nan
+        ts = TimeSeriesData(df)
+        m = SARIMAModel(data=ts, params=params)
+        self.assertFalse(_sarima_innovations.can_fit(m._get_sarimax()))
+        # the Kalman filter skips the missing observation
+        m.fit(**TEST_DATA["monthly"]["m1"])
+        self.assertTrue(np.isfinite(m.model.llf))
+        self.assertFalse(m.predict(steps=STEPS_1).fcst.isna().any())
+
+    def test_innovations_invalid_start_params(self) -> None:
+        m = SARIMAModel(
+            data=TEST_DATA["monthly"]["ts"], params=TEST_DATA["monthly"]["p1"]
+        )
+        # a non-invertible MA start falls back to the default start
+        m.fit(start_params=np.array([0.5, 2.0, 100.0]))
+        self.assertTrue(np.all(np.isfinite(m.model.params)))
+
+    def test_fit_grid(self) -> None:
+        m = SARIMAModel(
+            data=TEST_DATA["monthly"]["ts"], params=TEST_DATA["monthly"]["p1"]
+        )
+        param_list = [TEST_DATA["monthly"]["p1"], SARIMAParams(p=2, d=1, q=1)]
+        fitted = m.fit_grid(param_list, n_jobs=2, **TEST_DATA["monthly"]["m1"])
+        self.assertEqual(len(fitted), len(param_list))
+        for params, fm in zip(param_list, fitted):
+            single = SARIMAModel(data=TEST_DATA["monthly"]["ts"], params=params)
+            single.fit(**TEST_DATA["monthly"]["m1"])
+            np.testing.assert_allclose(fm.model.params, single.model.params)
+
     def test_exec_plot(self) -> None:
         m = SARIMAModel(
             data=TEST_DATA["monthly"]["ts"], params=TEST_DATA["monthly"]["p1"]
@@ -3,7 +3,6 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-import sys
 import unittest
 import unittest.mock as mock
 from typing import Any, Dict
@@ -27,6 +26,7 @@ from kats.models.ensemble.kats_ensemble import KatsEnsemble
 from kats.models.ensemble.median_ensemble import MedianEnsembleModel
 from kats.models.ensemble.weighted_avg_ensemble import WeightedAvgEnsemble
 from kats.models.model import Model
+from kats.utils.testing import mock_pool_predictions
 from parameterized.parameterized import parameterized
 
 np.random.seed(123321)
@@ -527,8 +527,10 @@ class testKatsEnsemble(TestCase):
 
             m = KatsEnsemble(data=ts_data, params=KatsEnsembleParam)
 
-            with mock.patch("multiprocessing.managers.SyncManager.Pool") as mock_pooled:
-                mock_fit_model = mock_pooled.return_value.apply_async.return_value.get
+            with mock.patch(
+                "kats.models.ensemble.kats_ensemble._get_pool"
+            ) as mock_pooled:
+                mock_fit_model = mock_pool_predictions(mock_pooled)
                 mock_fit_model.return_value.predict = mock.MagicMock(return_value=preds)
                 # fit the model
                 m.fit()
@@ -588,10 +590,12 @@ class testKatsEnsemble(TestCase):
             }
             m = KatsEnsemble(data=ts_data, params=KatsEnsembleParam)
 
-            with mock.patch("multiprocessing.managers.SyncManager.Pool") as mock_pooled:
-                mock_fit_model = mock_pooled.return_value.apply_async.return_value.get
+            with mock.patch(
+                "kats.models.ensemble.kats_ensemble._get_pool"
+            ) as mock_pooled:
+                mock_fit_model = mock_pool_predictions(mock_pooled)
                 mock_fit_model.return_value.predict = mock.MagicMock(return_value=preds)
-                mock_fit_model.return_value.__add__ = mock.MagicMock(
+                mock_fit_model.return_value.__float__ = mock.MagicMock(
                     return_value=np.random.rand()
                 )
                 # fit the model
@@ -601,9 +605,7 @@ class testKatsEnsemble(TestCase):
                 # no predictions should be made yet
                 mock_fit_model.return_value.predict.assert_not_called()
                 # backtesting should be done after calling fit
-                mock_fit_model.return_value.__add__.assert_called_with(
-                    sys.float_info.epsilon
-                )
+                mock_fit_model.return_value.__float__.assert_called()
 
                 # now run predict on the ensemble model
                 m.predict(steps=steps)
@@ -615,16 +617,14 @@ class testKatsEnsemble(TestCase):
                 mock_pooled.reset_mock()
                 mock_pooled.assert_not_called()
                 mock_fit_model.return_value.predict.assert_not_called()
-                mock_fit_model.return_value.__add__.assert_not_called()
+                mock_fit_model.return_value.__float__.assert_not_called()
 
                 # now retry the above with forecast rather than fit/predict
                 m.forecast(steps=30)
                 mock_pooled.assert_called()
 
                 # backtesting should be done after calling fit
-                mock_fit_model.return_value.__add__.assert_called_with(
-                    sys.float_info.epsilon
-                )
+                mock_fit_model.return_value.__float__.assert_called()
 
                 # now run predict on the ensemble model
                 m.predict(steps=steps)
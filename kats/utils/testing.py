@@ -7,6 +7,10 @@
 Utilities for testing and evaluation.
 """
 
+import unittest.mock as mock
+from concurrent.futures import Future
+from typing import Any
+
 try:
     from plotly.graph_objs import Figure
 except ImportError:
@@ -22,6 +26,26 @@ class PlotlyAdapter:
         self.fig.write_image(path)
 
 
+def mock_pool_predictions(mock_pooled: mock.MagicMock) -> mock.MagicMock:
+    """Set up a patched `_get_pool` whose tasks all return one mocked model.
+
+    Predictions are submitted to the shared pool as well; they run inline so
+    that the mocked model's `predict` gets called as with a real pool.
+    """
+    mock_fit_model = mock_pooled.return_value.submit.return_value.result
+
+    def submit(fn: Any, *args: Any, **kwargs: Any) -> Any:
+        if fn is mock_fit_model.return_value.predict:
+            future = Future()
+            future.set_result(fn(*args, **kwargs))
+            return future
+        return mock.DEFAULT
+
+    mock_pooled.return_value.submit.side_effect = submit
+    return mock_fit_model
+
+
 __all__ = [
     "PlotlyAdapter",
+    "mock_pool_predictions",
 ]